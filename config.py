@@ -4,7 +4,7 @@ Configuration settings for Visual Elements Orchestrator
 Uses pydantic-settings for environment variable management with .env file support.
 """
 
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -18,12 +18,42 @@ class Settings(BaseSettings):
     IMAGE_SERVICE_URL: str = "http://localhost:8000"
     INFOGRAPHIC_SERVICE_URL: str = "http://localhost:8000"
     LAYOUT_SERVICE_URL: str = "http://localhost:8504"
+    LAYOUT_HTTP2_PRIOR_KNOWLEDGE: bool = False  # Speak HTTP/2 (h2c) to a plain http:// Layout Service
+    LAYOUT_BINARY_IMAGE_UPLOAD: bool = False  # Upload base64 images as raw bytes (needs .../images/{id}/binary)
 
     # Timeouts (in seconds)
     SERVICE_TIMEOUT: float = 30.0
     DIAGRAM_POLL_TIMEOUT: float = 60.0  # Diagram uses async polling
+    DIAGRAM_LONG_POLL_WAIT: float = 25.0  # Server-side wait per status request
     IMAGE_TIMEOUT: float = 60.0  # Image generation can take longer
 
+    # Concurrency limits
+    SERVICE_MAX_CONCURRENCY: int = 16  # In-flight requests per text/table service client
+    INFOGRAPHIC_MAX_CONCURRENCY: int = 16  # Ceiling for in-flight Illustrator generate calls
+    INFOGRAPHIC_TARGET_LATENCY: float = 10.0  # Grow concurrency only while calls finish within this
+
+    # Send multi-infographic requests as one batch call (needs backend support)
+    INFOGRAPHIC_BATCH_ENABLED: bool = False
+    TEXT_TABLE_BATCH_ENABLED: bool = False  # Text/table batch endpoints (/api/ai/{text,table}/batch)
+
+    # Metadata caches (types, styles): fresh window and stale-on-error window
+    CACHE_TTL: float = 300.0
+    CACHE_STALE_TTL: float = 3600.0
+    CREDITS_CACHE_TTL: float = 10.0  # Image credits change as images are generated
+    IMAGE_RESULT_CACHE_TTL: float = 86400.0  # Seeded image results are deterministic
+    INFOGRAPHIC_RESULT_CACHE_TTL: float = 600.0  # Identical infographic requests reuse the result
+    TEXT_TABLE_RESULT_CACHE_TTL: float = 0.0  # Opt-in: LLM output varies per call (0 disables)
+
+    # Circuit breaker: fail fast after N consecutive upstream failures
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_COOLDOWN: float = 30.0  # Seconds before a probe request is allowed
+
+    # Optional Redis shared cache across workers (disabled when unset)
+    REDIS_URL: Optional[str] = None
+
+    # Optional directory for cache snapshots that survive restarts (disabled when unset)
+    CACHE_DIR: Optional[str] = None
+
     # Server config
     HOST: str = "0.0.0.0"
     PORT: int = 8090
@@ -12,14 +12,19 @@ Architecture:
 Frontend -> Orchestrator -> AI Services -> Frontend -> postMessage -> Layout Service
 """
 
+import asyncio
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import settings
+from services.layout_service import layout_service
+from services.shared_cache import shared_cache
 from routers import (
     chart_router,
     diagram_router,
@@ -34,6 +39,13 @@ logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
+# Write log records from a background thread: request handling only enqueues
+# them, so a slow stream or file never blocks the event loop
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+log_listener.start()
 logger = logging.getLogger(__name__)
 
 
@@ -47,8 +59,24 @@ async def lifespan(app: FastAPI):
     logger.info(f"  Text/Table:  {settings.TEXT_TABLE_SERVICE_URL}")
     logger.info(f"  Image:       {settings.IMAGE_SERVICE_URL}")
     logger.info(f"  Infographic: {settings.INFOGRAPHIC_SERVICE_URL}")
+    # Fill the text constraints cache in the background; startup doesn't wait
+    constraints_warmup = asyncio.create_task(text_router.text_service.warmup())
     yield
     logger.info("Shutting down Visual Elements Orchestrator")
+    try:
+        constraints_warmup.cancel()
+        # Let the warmup finish unwinding before its client is closed
+        await asyncio.gather(constraints_warmup, return_exceptions=True)
+        await diagram_router.diagram_service.aclose()
+        await text_router.text_service.aclose()
+        await table_router.table_service.aclose()
+        await image_router.image_service.aclose()
+        await infographic_router.infographic_service.aclose()
+        await layout_service.aclose()
+        await shared_cache.aclose()
+    finally:
+        # Flush queued records (including any shutdown error) however we exit
+        log_listener.stop()
 
 
 app = FastAPI(
@@ -144,5 +172,6 @@ if __name__ == "__main__":
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
+        loop="auto",  # uvloop when installed (uvicorn[standard]), else asyncio
         reload=True
     )
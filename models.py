@@ -12,7 +12,7 @@ Defines request/response models for all visual element types:
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============================================================================
@@ -29,7 +29,11 @@ class GridPosition(BaseModel):
     Example:
         grid_row: "4/14" (spans rows 4 to 13)
         grid_column: "8/24" (spans columns 8 to 23)
+
+    Immutable (and hashable), so values derived from it can be cached.
     """
+    model_config = ConfigDict(frozen=True)
+
     grid_row: str = Field(..., description="CSS grid-row value, e.g., '4/14'")
     grid_column: str = Field(..., description="CSS grid-column value, e.g., '8/24'")
 
@@ -331,6 +335,10 @@ class TextGenerateRequest(BaseModel):
     format: TextFormat = TextFormat.PARAGRAPH
     max_words: Optional[int] = None
     language: Optional[str] = Field("en", description="ISO language code")
+    no_cache: bool = Field(
+        False,
+        description="Always generate new text instead of reusing a cached result for the same request"
+    )
 
 
 class TextGenerateResponse(BaseModel):
@@ -367,6 +375,10 @@ class TextTransformRequest(BaseModel):
         le=1.0,
         description="Transformation intensity (0.0-1.0)"
     )
+    no_cache: bool = Field(
+        False,
+        description="Always transform anew instead of reusing a cached result for the same request"
+    )
 
 
 class TextTransformResponse(BaseModel):
@@ -485,6 +497,10 @@ class TableGenerateRequest(BaseModel):
         None,
         description="Existing data as 2D array (first row is header if has_header=true)"
     )
+    no_cache: bool = Field(
+        False,
+        description="Always generate a new table instead of reusing a cached result for the same request"
+    )
 
 
 class TableGenerateResponse(BaseModel):
@@ -543,6 +559,10 @@ class TableTransformRequest(BaseModel):
     source_content: str = Field(..., description="HTML table to transform")
     transformation: TableTransformationType
     options: Optional[TableTransformOptions] = None
+    no_cache: bool = Field(
+        False,
+        description="Always transform anew instead of reusing a cached result for the same request"
+    )
 
 
 class TableTransformResponse(BaseModel):
@@ -634,6 +654,10 @@ class ImageGenerateRequest(BaseModel):
         None,
         description="Random seed for reproducibility"
     )
+    no_cache: bool = Field(
+        False,
+        description="Always generate a new image instead of reusing a cached result for the same seed"
+    )
 
 
 class ImageCreditsInfo(BaseModel):
@@ -757,6 +781,10 @@ class InfographicGenerateRequest(BaseModel):
         False,
         description="Generate sample data if no items provided"
     )
+    no_cache: bool = Field(
+        False,
+        description="Always generate a new infographic instead of reusing a cached result"
+    )
 
 
 class InfographicGeneratorType(str, Enum):
@@ -246,5 +246,5 @@ async def clear_diagram_cache():
     This forces the next request for types to fetch fresh data
     from the Diagram AI Service.
     """
-    diagram_service.clear_cache()
+    await diagram_service.clear_cache()
     return {"success": True, "message": "Diagram service cache cleared"}
@@ -86,7 +86,8 @@ async def generate_image(request: ImageGenerateRequest):
         quality=request.quality.value,
         aspect_ratio=request.aspect_ratio.value,
         negative_prompt=request.negative_prompt,
-        seed=request.seed
+        seed=request.seed,
+        no_cache=request.no_cache
     )
 
     # Handle error response
@@ -203,5 +204,5 @@ async def clear_image_cache():
     This forces the next request for styles to fetch fresh data
     from the Image AI Service.
     """
-    image_service.clear_cache()
+    await image_service.clear_cache()
     return {"success": True, "message": "Image service cache cleared"}
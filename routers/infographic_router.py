@@ -152,7 +152,8 @@ async def generate_infographic(request: InfographicGenerateRequest):
         icon_style=request.icon_style.value,
         item_count=request.item_count,
         items=request.items,
-        generate_data=request.generate_data
+        generate_data=request.generate_data,
+        use_cache=not request.no_cache
     )
 
     # Handle error response
@@ -243,5 +244,5 @@ async def clear_infographic_cache():
     This forces the next request for types to fetch fresh data
     from the Infographic AI Service.
     """
-    infographic_service.clear_cache()
+    await infographic_service.clear_cache()
     return {"success": True, "message": "Infographic service cache cleared"}
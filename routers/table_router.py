@@ -84,7 +84,8 @@ async def generate_table(request: TableGenerateRequest):
         columns=request.columns,
         rows=request.rows,
         has_header=request.has_header,
-        data=request.data
+        data=request.data,
+        no_cache=request.no_cache
     )
 
     # Handle error response
@@ -206,7 +207,8 @@ async def transform_table(request: TableTransformRequest):
             "gridWidth": grid_dims["width"],
             "gridHeight": grid_dims["height"]
         },
-        options=options
+        options=options,
+        no_cache=request.no_cache
     )
 
     # Handle error response
@@ -335,3 +337,15 @@ async def get_table_presets():
     """
     logger.debug("Fetching table presets")
     return table_service.get_presets()
+
+
+@router.post("/table/clear-cache")
+async def clear_table_cache():
+    """
+    Clear cached generated/transformed tables.
+
+    This forces the next generate or transform request to fetch fresh
+    data from the Table AI Service.
+    """
+    table_service.clear_cache()
+    return {"success": True, "message": "Table service cache cleared"}
@@ -83,7 +83,8 @@ async def generate_text(request: TextGenerateRequest):
         tone=request.tone.value,
         format=request.format.value,
         max_words=request.max_words,
-        language=request.language or "en"
+        language=request.language or "en",
+        no_cache=request.no_cache
     )
 
     # Handle error response
@@ -179,7 +180,8 @@ async def transform_text(request: TextTransformRequest):
             "gridHeight": grid_dims["height"]
         },
         target_language=request.target_language,
-        intensity=request.intensity
+        intensity=request.intensity,
+        no_cache=request.no_cache
     )
 
     # Handle error response
@@ -339,10 +341,10 @@ async def get_text_constraints(width: int, height: int):
 @router.post("/text/clear-cache")
 async def clear_text_cache():
     """
-    Clear cached text constraints.
+    Clear cached text constraints and generated/transformed text.
 
-    This forces the next constraint request to fetch fresh data
-    from the Text AI Service.
+    This forces the next constraint request, and the next generate or
+    transform request, to fetch fresh data from the Text AI Service.
     """
     text_service.clear_cache()
     return {"success": True, "message": "Text service cache cleared"}
@@ -0,0 +1,350 @@
+"""
+Base class for simple request/response AI service clients
+
+Text and table endpoints are plain JSON POSTs with no polling, so their
+clients share one code path: _post_json sends the request, retries
+transient failures (connection errors, timeouts) with jittered backoff, and
+maps any remaining failure to the standard error dict (see services.errors).
+
+_generate_batch sends several generate requests (e.g. every text element on
+a slide) as one {"items": [...]} POST when the backend has a batch endpoint,
+and otherwise fans them out with bounded concurrency.
+
+Every request holds one of max_concurrency slots while it is in flight, so a
+burst of generate calls queues here instead of exhausting the connection
+pool and piling timeouts (and their retries) onto the LLM backend.
+
+When a result cache TTL is configured, calls made with cache=True
+(generate/transform) reuse a successful response for an identical request
+body until it expires, skipping the LLM entirely; no_cache=True asks for a
+fresh generation, which then replaces the cached entry. Prompts are compared
+with runs of whitespace collapsed, so a re-issued prompt that only differs in
+spacing still hits; case and punctuation are significant.
+"""
+
+import asyncio
+import hashlib
+import logging
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional
+
+import httpx
+import orjson
+from cachetools import TTLCache
+
+from config import settings
+from services.concurrency import gather_bounded
+from services.errors import service_error
+from services.http_client import JSON_HEADERS, shared_client
+from services.resilience import backoff_delay
+
+# Retries: connection failures never reached the server, so they are always
+# safe to resend; other timeouts may have started an LLM generation, so
+# generate/transform allow fewer attempts to bound tail latency and cost
+MAX_ATTEMPTS = 3
+GENERATE_ATTEMPTS = 2
+RETRY_BASE_DELAY = 0.2  # Backoff: base * 2**(attempt-1) plus up to base of jitter
+RETRY_MAX_DELAY = 2.0
+
+# Max single requests in flight when a batch is sent item by item
+BATCH_FALLBACK_CONCURRENCY = 8
+
+# Backend SlideContext schema: required fields with their defaults, and
+# optional fields sent only when set
+_CONTEXT_DEFAULTS = MappingProxyType({
+    "presentationTitle": "Untitled",
+    "slideIndex": 0,
+    "slideCount": 1,
+})
+_CONTEXT_OPTIONAL = ("presentationTheme", "slideTitle")
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Collapse runs of whitespace and trim the ends"""
+    return " ".join(prompt.split())
+
+
+def _result_key(path: str, body: Dict[str, Any]) -> str:
+    """Result cache key: hash of the path and the body with its prompt normalized"""
+    prompt = body.get("prompt")
+    if isinstance(prompt, str):
+        body = {**body, "prompt": _normalize_prompt(prompt)}
+    return hashlib.blake2b(
+        path.encode() + orjson.dumps(body, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
+
+
+def build_slide_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the backend SlideContext object from a request's context dict"""
+    backend_context = {key: context.get(key, default) for key, default in _CONTEXT_DEFAULTS.items()}
+    for key in _CONTEXT_OPTIONAL:
+        if context.get(key):
+            backend_context[key] = context[key]
+    return backend_context
+
+
+class BaseAIService:
+    """
+    Shared plumbing for JSON-over-HTTP AI service clients.
+
+    Subclasses set `service_name` (used in error messages) and call
+    super().__init__ with their base URL and timeout.
+    """
+
+    service_name = "AI"
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float,
+        batch_enabled: bool = False,
+        max_concurrency: Optional[int] = None,
+        result_cache_ttl: float = 0.0
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._logger = logging.getLogger(type(self).__module__)
+        self._batch_supported = batch_enabled
+        self.max_concurrency = max(1, max_concurrency or settings.SERVICE_MAX_CONCURRENCY)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._in_flight = 0
+        # Raw response bodies, decoded per hit so no caller shares a dict.
+        # Disabled (None) unless a positive TTL is configured
+        self._result_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=1024, ttl=result_cache_ttl) if result_cache_ttl > 0 else None
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP/2 client shared with other services on the same upstream"""
+        if self._client is None or self._client.is_closed:
+            self._client = shared_client(self.base_url, self.timeout)
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def clear_result_cache(self):
+        """Drop cached generate/transform results"""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def concurrency_stats(self) -> Dict[str, int]:
+        """Current request concurrency: limit, requests in flight, and free slots"""
+        return {
+            "limit": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "available": self.max_concurrency - self._in_flight
+        }
+
+    async def _post(self, path: str, attempts: int = 1, **kwargs: Any) -> httpx.Response:
+        """
+        POST through the shared client once a concurrency slot is free.
+
+        Connection failures are retried up to MAX_ATTEMPTS in total, other
+        timeouts up to `attempts`, with jittered exponential backoff. The
+        slot is released while waiting to retry.
+
+        Returns:
+            The response (status not yet checked)
+
+        Raises:
+            httpx.TimeoutException, httpx.ConnectError: on the final attempt
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with self._semaphore:
+                    self._in_flight += 1
+                    try:
+                        return await self._get_client().post(path, **kwargs)
+                    finally:
+                        self._in_flight -= 1
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                if attempt >= MAX_ATTEMPTS:
+                    raise
+                reason = type(e).__name__
+            except httpx.TimeoutException as e:
+                if attempt >= attempts:
+                    raise
+                reason = type(e).__name__
+
+            delay = backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+            self._logger.warning(
+                "%s service POST %s: %s, retrying in %.1fs (attempt %d)",
+                self.service_name, path, reason, delay, attempt
+            )
+            await asyncio.sleep(delay)
+
+    async def _post_json(
+        self,
+        path: str,
+        body: Dict[str, Any],
+        *,
+        element_id: str,
+        action: str,
+        timeout_message: str,
+        cache: bool = False,
+        no_cache: bool = False,
+        attempts: int = MAX_ATTEMPTS
+    ) -> Dict[str, Any]:
+        """
+        POST a JSON body and return the decoded response.
+
+        Args:
+            path: Endpoint path relative to base_url
+            body: Request body
+            element_id: Element the call is for (logs)
+            action: What the call does, e.g. "text generation" (logs)
+            timeout_message: Message returned for TIMEOUT errors
+            cache: Reuse the successful response of an identical earlier request
+            no_cache: With cache, skip the lookup and always call upstream; a
+                successful response still replaces the cached entry
+            attempts: Total tries when the request times out (see _post)
+
+        Returns:
+            The upstream response dict, or an error dict on failure
+        """
+        key = None
+        if cache and self._result_cache is not None:
+            key = _result_key(path, body)
+            cached = None if no_cache else self._result_cache.get(key)
+            if cached is not None:
+                self._logger.info("Returning cached %s for element %s", action, element_id)
+                return {**orjson.loads(cached), "_cached": True}
+
+        try:
+            response = await self._post(
+                path, attempts, content=orjson.dumps(body), headers=JSON_HEADERS
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+        except Exception as e:
+            return service_error(
+                e, self.service_name, timeout_message, action, self.base_url, element_id, self._logger
+            )
+        self._logger.info("Completed %s: %s", action, element_id)
+        if key is not None and isinstance(result, dict) and result.get("success"):
+            self._result_cache[key] = response.content
+        return result
+
+    async def _generate_batch(
+        self,
+        path: str,
+        specs: List[Dict[str, Any]],
+        build_body: Callable[..., Dict[str, Any]],
+        generate: Callable[..., Awaitable[Dict[str, Any]]],
+        *,
+        action: str,
+        timeout_message: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several generate calls in one round-trip.
+
+        When batching is enabled, the request bodies are POSTed together as
+        {"items": [...]} and the response items are matched back by position.
+        Otherwise, or once the backend answers 404/405 to a batch, each spec
+        goes through `generate` with at most BATCH_FALLBACK_CONCURRENCY in
+        flight.
+
+        Args:
+            path: Batch endpoint path relative to base_url
+            specs: Keyword-argument dicts, one per generate call
+            build_body: Builds one item's request body from a spec
+            generate: Single-item generate method, used for the fallback
+            action: What the call does, e.g. "text generation" (logs)
+            timeout_message: Message returned for TIMEOUT errors
+
+        Returns:
+            Result dicts in spec order
+        """
+        if not self._batch_supported or len(specs) < 2:
+            return await self._gather_generate(generate, specs)
+
+        element_ids = ",".join(str(spec.get("element_id")) for spec in specs)
+        try:
+            # no_cache only concerns the single-item path; batches are never cached
+            body = orjson.dumps({"items": [
+                build_body(**{k: v for k, v in spec.items() if k != "no_cache"}) for spec in specs
+            ]})
+            response = await self._post(path, content=body, headers=JSON_HEADERS)
+            unsupported = response.status_code in (404, 405)
+            if not unsupported:
+                response.raise_for_status()
+                items = orjson.loads(response.content).get("items")
+        except Exception as e:
+            error = service_error(
+                e, self.service_name, timeout_message, f"batch {action}", self.base_url, element_ids, self._logger
+            )
+            # One copy per slot; the error detail may be a shared read-only mapping
+            detail = error["error"]
+            return [
+                {**error, "error": dict(detail) if isinstance(detail, Mapping) else detail}
+                for _ in specs
+            ]
+
+        if unsupported:
+            self._logger.warning(
+                "%s service does not support batch generation; sending items individually", self.service_name
+            )
+            self._batch_supported = False
+            return await self._gather_generate(generate, specs)
+
+        if not isinstance(items, list) or len(items) != len(specs):
+            return [
+                {
+                    "success": False,
+                    "error": {
+                        "code": "INTERNAL_ERROR",
+                        "message": f"{self.service_name} batch response did not match the request",
+                        "retryable": True
+                    }
+                }
+                for _ in specs
+            ]
+
+        self._logger.info("Completed batch %s: %s", action, element_ids)
+        return items
+
+    async def _gather_generate(
+        self,
+        generate: Callable[..., Awaitable[Dict[str, Any]]],
+        specs: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run `generate` for each spec with bounded concurrency.
+
+        One failing item never cancels the others: an exception is returned
+        as an INTERNAL_ERROR dict in that item's slot.
+        """
+        results = await gather_bounded(
+            (partial(generate, **spec) for spec in specs), BATCH_FALLBACK_CONCURRENCY
+        )
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                self._logger.error(
+                    "%s generation failed for element %s: %s",
+                    self.service_name, specs[index].get("element_id"), result
+                )
+                results[index] = {
+                    "success": False,
+                    "error": {
+                        "code": "INTERNAL_ERROR",
+                        "message": str(result),
+                        "retryable": False
+                    }
+                }
+        return results
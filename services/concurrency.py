@@ -0,0 +1,109 @@
+"""
+Concurrency helpers for AI service clients
+
+Used to fan out independent element generations (e.g. every diagram or
+image on a slide) without letting one batch monopolise the connection pool,
+and to adapt in-flight request counts to what an upstream can absorb.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Iterable, List
+
+
+async def gather_bounded(
+    calls: Iterable[Callable[[], Awaitable[Any]]],
+    concurrency: int = 8
+) -> List[Any]:
+    """
+    Run zero-argument coroutine factories concurrently, at most `concurrency` at a time.
+
+    Args:
+        calls: Callables that each return an awaitable when invoked
+        concurrency: Maximum number of calls in flight
+
+    Returns:
+        Results in input order; a call that raised yields its exception
+        instead of a result (asyncio.gather with return_exceptions=True)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(call: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await call()
+
+    return await asyncio.gather(*(_run(call) for call in calls), return_exceptions=True)
+
+
+class AIMDLimiter:
+    """
+    Adaptive concurrency limit (additive increase, multiplicative decrease).
+
+    Like a semaphore whose size follows the upstream's capacity: each fast
+    successful response grows the limit by `increase`, and each overload
+    signal (429, 5xx, timeout) multiplies it by `decrease`. The limit stays
+    within [minimum, maximum].
+
+    Usage:
+        async with limiter:
+            started = time.monotonic()
+            response = await client.post(...)
+            limiter.record_response(response.status_code, time.monotonic() - started)
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        target_latency: float = 10.0,
+        increase: float = 0.5,
+        decrease: float = 0.5
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(self.maximum)
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    async def __aenter__(self) -> "AIMDLimiter":
+        while self._in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass a wake-up we may have consumed on to the next waiter
+                self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        free = int(self.limit) - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def record_response(self, status_code: int, latency: float):
+        """Adjust the limit from an upstream response."""
+        if status_code == 429 or status_code >= 500:
+            self.record_overload()
+        elif status_code < 400 and latency <= self.target_latency:
+            self.limit = min(self.maximum, self.limit + self.increase)
+            self._wake()
+
+    def record_overload(self):
+        """Back off after a rate limit, server error or timeout."""
+        self.limit = max(self.minimum, self.limit * self.decrease)
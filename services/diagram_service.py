@@ -3,9 +3,10 @@ Diagram AI Service Client
 
 Handles communication with the Diagram Generator v3.0 endpoints.
 
-Uses async polling pattern:
+Uses async long-polling pattern:
 1. POST /api/ai/diagram/generate → returns jobId
-2. GET /api/ai/diagram/status/{jobId} → poll until complete/failed
+2. GET /api/ai/diagram/status/{jobId}?wait=N → blocks until complete/failed
+   or the wait window elapses, then reconnects
 3. Return SVG/Mermaid result
 
 Endpoints:
@@ -16,38 +17,94 @@ Endpoints:
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache, partial
+from math import gcd
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple
 
 import httpx
+import orjson
 
 from config import settings
+from services.concurrency import gather_bounded
+from services.errors import wrap_service_errors
+from services.http_client import JSON_HEADERS, create_client
+from services.resilience import CircuitBreaker
+from services.shared_cache import shared_cache
 
 logger = logging.getLogger(__name__)
 
+# Delay before the second status check when the backend does not long-poll.
+# The first check goes out right after submission; fast jobs (e.g. supplied
+# Mermaid code) are usually done well before a full poll interval.
+FIRST_POLL_DELAY = 0.5
+
+# Once a diagram type has completed before, the first delay is instead half
+# its smoothed (EWMA) completion time, but never below MIN_FIRST_POLL_DELAY
+MIN_FIRST_POLL_DELAY = 0.3
+DURATION_EWMA_ALPHA = 0.2
+
+
+# Default theme matching backend DiagramTheme schema ("style" is set per request)
+DEFAULT_DIAGRAM_THEME = MappingProxyType({
+    "primaryColor": "#3B82F6",  # Default blue
+    "colorScheme": "complementary",
+    "backgroundColor": "#FFFFFF",
+    "textColor": "#1F2937",
+    "fontFamily": "Inter, system-ui, sans-serif",
+    "useSmartTheming": True
+})
 
 # Minimum grid sizes per diagram type (in 12×8 grid)
 DIAGRAM_MIN_SIZES = {
-    "flowchart": {"width": 3, "height": 2},
-    "sequence": {"width": 4, "height": 3},
-    "class": {"width": 4, "height": 3},
-    "state": {"width": 3, "height": 3},
-    "er": {"width": 4, "height": 3},
-    "gantt": {"width": 6, "height": 2},
-    "userjourney": {"width": 4, "height": 2},
-    "gitgraph": {"width": 4, "height": 2},
-    "mindmap": {"width": 4, "height": 4},
-    "pie": {"width": 3, "height": 3},
-    "timeline": {"width": 5, "height": 2},
+    "flowchart": MappingProxyType({"width": 3, "height": 2}),
+    "sequence": MappingProxyType({"width": 4, "height": 3}),
+    "class": MappingProxyType({"width": 4, "height": 3}),
+    "state": MappingProxyType({"width": 3, "height": 3}),
+    "er": MappingProxyType({"width": 4, "height": 3}),
+    "gantt": MappingProxyType({"width": 6, "height": 2}),
+    "userjourney": MappingProxyType({"width": 4, "height": 2}),
+    "gitgraph": MappingProxyType({"width": 4, "height": 2}),
+    "mindmap": MappingProxyType({"width": 4, "height": 4}),
+    "pie": MappingProxyType({"width": 3, "height": 3}),
+    "timeline": MappingProxyType({"width": 5, "height": 2}),
 }
 
+_DEFAULT_MIN_SIZE = MappingProxyType({"width": 3, "height": 3})
+
+
+# Request fields that are identical on every submission; per-call fields are
+# layered on top. Tuples serialize as JSON arrays and can't be mutated.
+DIAGRAM_REQUEST_SKELETON = MappingProxyType({
+    "data_points": (),  # Empty list, AI will generate
+})
+DIAGRAM_CONSTRAINTS_SKELETON = MappingProxyType({
+    "animationEnabled": False,
+})
+
+
+@lru_cache(maxsize=64)
+def _backend_diagram_type(diagram_type: str) -> str:
+    """Backend diagram_type spelling (snake_case), e.g. "user-journey" -> "user_journey"."""
+    return diagram_type.lower().replace("-", "_")
+
+
+@lru_cache(maxsize=128)
+def _aspect_ratio(grid_width: int, grid_height: int) -> str:
+    """Reduced aspect ratio string for a grid size, e.g. 8x6 -> "4:3"."""
+    divisor = gcd(grid_width, grid_height)
+    return f"{grid_width // divisor}:{grid_height // divisor}"
+
 
 class DiagramService:
     """
     Client for the Diagram AI Service.
 
     Features:
-        - Async job submission with polling
-        - Configurable polling interval and max attempts
+        - Shared pooled HTTP/2 client (connections reused across calls)
+        - Async job submission with long-polling
+        - Interval polling fallback for backends without long-poll support
         - Response caching for diagram types
         - Error handling with retryable status
     """
@@ -56,8 +113,32 @@ class DiagramService:
         self.base_url = settings.DIAGRAM_SERVICE_URL
         self.timeout = settings.SERVICE_TIMEOUT
         self.poll_timeout = settings.DIAGRAM_POLL_TIMEOUT
-        self._types_cache: Optional[Dict[str, Any]] = None
+        self.long_poll_wait = settings.DIAGRAM_LONG_POLL_WAIT
+        self.cache_ttl = settings.CACHE_TTL
+        self.cache_stale_ttl = settings.CACHE_STALE_TTL
+        self._types_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._types_inflight: Optional["asyncio.Task[Dict[str, Any]]"] = None
+        self._duration_ewma: Dict[str, float] = {}  # diagram_type -> seconds
+        self._client: Optional[httpx.AsyncClient] = None
+        self._breaker = CircuitBreaker(
+            "Diagram service",
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            cooldown=settings.CIRCUIT_COOLDOWN
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = create_client(self.base_url, self.timeout)
+        return self._client
 
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @wrap_service_errors("Diagram", "Diagram service timed out. Please try again.", "diagram job submission")
     async def submit_job(
         self,
         prompt: str,
@@ -102,13 +183,8 @@ class DiagramService:
 
         # Build theme object matching backend DiagramTheme schema
         theme_obj = {
-            "primaryColor": "#3B82F6",  # Default blue
-            "colorScheme": "complementary",
-            "backgroundColor": "#FFFFFF",
-            "textColor": "#1F2937",
-            "fontFamily": "Inter, system-ui, sans-serif",
-            "style": theme if isinstance(theme, str) else "professional",
-            "useSmartTheming": True
+            **DEFAULT_DIAGRAM_THEME,
+            "style": theme if isinstance(theme, str) else "professional"
         }
 
         # Extract brand colors from context if available
@@ -123,18 +199,14 @@ class DiagramService:
             "maxHeight": max_height,
             "orientation": "landscape" if grid_width > grid_height else "portrait",
             "complexity": complexity,
-            "animationEnabled": False
+            "aspectRatio": _aspect_ratio(grid_width, grid_height),
+            **DIAGRAM_CONSTRAINTS_SKELETON
         }
 
-        # Calculate aspect ratio
-        from math import gcd
-        divisor = gcd(grid_width, grid_height)
-        backend_constraints["aspectRatio"] = f"{grid_width // divisor}:{grid_height // divisor}"
-
         request_body = {
+            **DIAGRAM_REQUEST_SKELETON,
             "content": prompt,  # Backend uses 'content' not 'prompt'
-            "diagram_type": diagram_type.lower().replace("-", "_"),  # snake_case
-            "data_points": [],  # Empty list, AI will generate
+            "diagram_type": _backend_diagram_type(diagram_type),  # snake_case
             "theme": theme_obj,
             "constraints": backend_constraints,
             "correlation_id": element_id,
@@ -146,94 +218,92 @@ class DiagramService:
             # If mermaid code provided, add it as additional context
             request_body["content"] = f"{prompt}\n\nMermaid code:\n{mermaid_code}"
 
-        logger.info(f"Submitting diagram job: type={diagram_type}, element={element_id}")
-        logger.debug(f"Request body: {request_body}")
+        logger.info("Submitting diagram job: type=%s, element=%s", diagram_type, element_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body: %s", request_body)
+
+        client = self._get_client()
+        response = await client.post(
+            "/api/ai/diagram/generate",
+            content=orjson.dumps(request_body),
+            headers=JSON_HEADERS
+        )
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        logger.info("Diagram job submitted: %s", result.get("jobId"))
+        return result
+
+    async def poll_status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Poll the status of a diagram generation job.
+
+        Args:
+            job_id: Job identifier from submit_job
+
+        Returns:
+            Dict with status, progress, and result (if complete)
+        """
+        logger.debug("Polling diagram job status: %s", job_id)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/ai/diagram/generate",
-                    json=request_body
-                )
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Diagram job submitted: {result.get('jobId')}")
-                return result
-
-        except httpx.TimeoutException:
-            logger.error(f"Diagram service timeout for element {element_id}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "TIMEOUT",
-                    "message": "Diagram service timed out. Please try again.",
-                    "retryable": True
-                }
-            }
+            client = self._get_client()
+            response = await client.get(
+                f"/api/ai/diagram/status/{job_id}"
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"Diagram service HTTP error: {e.response.status_code}")
-            try:
-                error_data = e.response.json()
-                return {
-                    "success": False,
-                    "error": error_data.get("error", {
-                        "code": f"HTTP_{e.response.status_code}",
-                        "message": str(e),
-                        "retryable": e.response.status_code >= 500
-                    })
-                }
-            except Exception:
+            if e.response.status_code == 404:
                 return {
-                    "success": False,
-                    "error": {
-                        "code": f"HTTP_{e.response.status_code}",
-                        "message": f"Diagram service returned status {e.response.status_code}",
-                        "retryable": e.response.status_code >= 500
-                    }
+                    "status": "failed",
+                    "error": f"Job {job_id} not found"
                 }
-
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Diagram service at {self.base_url}")
             return {
-                "success": False,
-                "error": {
-                    "code": "CONNECTION_ERROR",
-                    "message": "Unable to connect to Diagram AI service. Please try again later.",
-                    "retryable": True
-                }
+                "status": "failed",
+                "error": f"HTTP error: {e.response.status_code}"
             }
 
         except Exception as e:
-            logger.exception(f"Unexpected error in diagram job submission: {e}")
+            logger.error("Error polling diagram status: %s", e)
             return {
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": str(e),
-                    "retryable": False
-                }
+                "status": "failed",
+                "error": str(e)
             }
 
-    async def poll_status(self, job_id: str) -> Dict[str, Any]:
+    async def poll_status_long(self, job_id: str, wait_seconds: float = 25.0) -> Dict[str, Any]:
         """
-        Poll the status of a diagram generation job.
+        Long-poll the status of a diagram generation job.
+
+        The backend holds the request open until the job reaches a terminal
+        state or ``wait_seconds`` elapse, so completion is observed as soon as
+        it happens instead of on the next polling tick.
 
         Args:
             job_id: Job identifier from submit_job
+            wait_seconds: Server-side wait window for the request
 
         Returns:
             Dict with status, progress, and result (if complete)
         """
-        logger.debug(f"Polling diagram job status: {job_id}")
+        logger.debug("Long-polling diagram job status: %s (wait=%ss)", job_id, wait_seconds)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/ai/diagram/status/{job_id}"
-                )
-                response.raise_for_status()
-                return response.json()
+            client = self._get_client()
+            response = await client.get(
+                f"/api/ai/diagram/status/{job_id}",
+                params={"wait": max(1, int(wait_seconds))},
+                # Only the read waits out the window; connecting keeps the normal timeout
+                timeout=httpx.Timeout(wait_seconds + 5, connect=self.timeout)
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+        except httpx.ReadTimeout:
+            # Wait window elapsed without an answer - the job is still running.
+            # Connect/pool timeouts mean the backend is unreachable and fall
+            # through to the failure below
+            return {"status": "processing"}
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -247,13 +317,13 @@ class DiagramService:
             }
 
         except Exception as e:
-            logger.error(f"Error polling diagram status: {e}")
+            logger.error("Error long-polling diagram status: %s", e)
             return {
                 "status": "failed",
                 "error": str(e)
             }
 
-    async def generate_with_polling(
+    async def stream_generation(
         self,
         prompt: str,
         diagram_type: str,
@@ -268,19 +338,23 @@ class DiagramService:
         mermaid_code: Optional[str] = None,
         max_polls: int = 30,
         poll_interval: float = 2.0
-    ) -> Dict[str, Any]:
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Generate a diagram with automatic polling until complete.
+        Generate a diagram, yielding status updates as the job progresses.
+
+        Yields {"status": "submitted", "job_id": ...} once the job is accepted,
+        then each status payload from the backend tagged with "job_id". Every
+        update has a "done" flag, set after the backend payload so it can't be
+        overridden by it. Only the last update has done=True: its status is
+        terminal ("completed", "failed" or "timeout") and it carries the final
+        result dict under "result". Closing the iterator early stops polling
+        and releases the connection.
 
         Args:
-            prompt: Description of the diagram
-            diagram_type: Type of diagram
-            ... (same as submit_job)
-            max_polls: Maximum number of poll attempts (default 30 = 60 seconds)
-            poll_interval: Seconds between polls (default 2.0)
+            Same as generate_with_polling
 
-        Returns:
-            Dict with success status and either diagram result or error details
+        Yields:
+            Status update dicts
         """
         # Submit the job
         submit_result = await self.submit_job(
@@ -298,86 +372,253 @@ class DiagramService:
         )
 
         if not submit_result.get("success", True):
-            return submit_result
+            yield {"status": "failed", "job_id": None, "done": True, "result": submit_result}
+            return
 
         job_id = submit_result.get("jobId")
         if not job_id:
             # Direct result (no polling needed)
-            return submit_result
-
-        # Poll for completion
-        logger.info(f"Polling diagram job {job_id} (max {max_polls} attempts)")
-
-        for attempt in range(max_polls):
-            await asyncio.sleep(poll_interval)
-
-            status_result = await self.poll_status(job_id)
+            yield {"status": "completed", "job_id": None, "done": True, "result": submit_result}
+            return
+
+        yield {"status": "submitted", "job_id": job_id, "done": False}
+
+        # Long-poll for completion: each status request blocks server-side until
+        # the job finishes or the wait window elapses, then we simply reconnect.
+        timeout_seconds = max_polls * poll_interval
+        loop = asyncio.get_running_loop()
+        submitted_at = loop.time()
+        deadline = submitted_at + timeout_seconds
+        first_delay = self._first_poll_delay(diagram_type)
+        logger.info("Long-polling diagram job %s (timeout %ss)", job_id, timeout_seconds)
+
+        attempt = 0
+        while loop.time() < deadline:
+            attempt += 1
+            started = loop.time()
+            wait_seconds = min(self.long_poll_wait, deadline - started)
+
+            status_result = await self.poll_status_long(job_id, wait_seconds=wait_seconds)
             status = status_result.get("status", "unknown")
 
-            logger.debug(f"Poll {attempt + 1}/{max_polls}: status={status}")
+            logger.debug("Poll %d: status=%s", attempt, status)
 
             if status == "completed":
-                logger.info(f"Diagram job {job_id} completed successfully")
-                return {
-                    "success": True,
+                logger.info("Diagram job %s completed successfully", job_id)
+                self._record_duration(diagram_type, loop.time() - submitted_at)
+                yield {
+                    **status_result,
                     "job_id": job_id,
-                    "mermaid_code": status_result.get("mermaidCode"),
-                    "svg_content": status_result.get("svgContent"),
-                    "diagram_type": diagram_type
+                    "done": True,
+                    "result": {
+                        "success": True,
+                        "job_id": job_id,
+                        "mermaid_code": status_result.get("mermaidCode"),
+                        "svg_content": status_result.get("svgContent"),
+                        "diagram_type": diagram_type
+                    }
                 }
+                return
 
             elif status == "failed":
                 error_msg = status_result.get("error", "Unknown error")
-                logger.error(f"Diagram job {job_id} failed: {error_msg}")
-                return {
-                    "success": False,
+                logger.error("Diagram job %s failed: %s", job_id, error_msg)
+                yield {
+                    **status_result,
                     "job_id": job_id,
-                    "error": {
-                        "code": "GENERATION_FAILED",
-                        "message": error_msg,
-                        "retryable": True
+                    "done": True,
+                    "result": {
+                        "success": False,
+                        "job_id": job_id,
+                        "error": {
+                            "code": "GENERATION_FAILED",
+                            "message": error_msg,
+                            "retryable": True
+                        }
                     }
                 }
+                return
 
             elif status not in ("pending", "processing"):
-                logger.warning(f"Unknown diagram job status: {status}")
+                logger.warning("Unknown diagram job status: %s", status)
+
+            yield {**status_result, "job_id": job_id, "done": False}
+
+            # A backend without long-poll support answers immediately; fall back
+            # to interval polling instead of spinning against it. The first
+            # follow-up is timed from how long this diagram type usually takes.
+            interval = first_delay if attempt == 1 else poll_interval
+            idle = min(interval - (loop.time() - started), deadline - loop.time())
+            if idle > 0:
+                await asyncio.sleep(idle)
 
         # Polling timed out
-        logger.error(f"Diagram job {job_id} polling timed out after {max_polls} attempts")
-        return {
-            "success": False,
+        logger.error("Diagram job %s polling timed out after %d attempts", job_id, attempt)
+        yield {
+            "status": "timeout",
             "job_id": job_id,
-            "error": {
-                "code": "POLL_TIMEOUT",
-                "message": f"Diagram generation timed out after {max_polls * poll_interval} seconds",
-                "retryable": True
+            "done": True,
+            "result": {
+                "success": False,
+                "job_id": job_id,
+                "error": {
+                    "code": "POLL_TIMEOUT",
+                    "message": f"Diagram generation timed out after {timeout_seconds} seconds",
+                    "retryable": True
+                }
             }
         }
 
+    def _first_poll_delay(self, diagram_type: str) -> float:
+        """Delay before the second status check, from past completion times."""
+        estimate = self._duration_ewma.get(diagram_type)
+        if estimate is None:
+            return FIRST_POLL_DELAY
+        return max(MIN_FIRST_POLL_DELAY, 0.5 * estimate)
+
+    def _record_duration(self, diagram_type: str, seconds: float):
+        """Fold a completed job's duration into the per-type EWMA."""
+        previous = self._duration_ewma.get(diagram_type)
+        if previous is None:
+            self._duration_ewma[diagram_type] = seconds
+        else:
+            self._duration_ewma[diagram_type] = (
+                (1 - DURATION_EWMA_ALPHA) * previous + DURATION_EWMA_ALPHA * seconds
+            )
+
+    async def generate_with_polling(
+        self,
+        prompt: str,
+        diagram_type: str,
+        presentation_id: str,
+        slide_id: str,
+        element_id: str,
+        context: Dict[str, Any],
+        constraints: Dict[str, int],
+        direction: str = "TB",
+        theme: str = "default",
+        complexity: str = "moderate",
+        mermaid_code: Optional[str] = None,
+        max_polls: int = 30,
+        poll_interval: float = 2.0
+    ) -> Dict[str, Any]:
+        """
+        Generate a diagram with automatic polling until complete.
+
+        Thin wrapper over stream_generation that returns only the final result.
+
+        Args:
+            prompt: Description of the diagram
+            diagram_type: Type of diagram
+            ... (same as submit_job)
+            max_polls: Polling budget in intervals (default 30 = 60 seconds)
+            poll_interval: Seconds between polls when the backend does not
+                support long-polling (default 2.0)
+
+        Returns:
+            Dict with success status and either diagram result or error details
+        """
+        updates = self.stream_generation(
+            prompt=prompt,
+            diagram_type=diagram_type,
+            presentation_id=presentation_id,
+            slide_id=slide_id,
+            element_id=element_id,
+            context=context,
+            constraints=constraints,
+            direction=direction,
+            theme=theme,
+            complexity=complexity,
+            mermaid_code=mermaid_code,
+            max_polls=max_polls,
+            poll_interval=poll_interval
+        )
+        try:
+            async for update in updates:
+                if update["done"]:
+                    return update["result"]
+        finally:
+            await updates.aclose()
+
+        # stream_generation always ends with a terminal update
+        raise RuntimeError("Diagram generation stream ended without a result")
+
+    async def generate_many_with_polling(
+        self,
+        jobs: List[Dict[str, Any]],
+        concurrency: int = 8
+    ) -> List[Any]:
+        """
+        Generate several diagrams concurrently.
+
+        Args:
+            jobs: Keyword-argument dicts, one per generate_with_polling call
+            concurrency: Maximum jobs in flight at once (default 8)
+
+        Returns:
+            Results in job order; a job that raised yields its exception
+        """
+        logger.info("Generating %d diagrams (concurrency %d)", len(jobs), concurrency)
+        return await gather_bounded(
+            (partial(self.generate_with_polling, **job) for job in jobs),
+            concurrency=concurrency
+        )
+
     async def get_types(self) -> Dict[str, Any]:
         """
         Get supported diagram types with their constraints.
 
-        Results are cached after first successful call.
+        Results are cached for CACHE_TTL seconds. If a refresh fails, the last
+        successful response is served (flagged "_stale") for up to
+        CACHE_STALE_TTL seconds before falling back to built-in defaults.
 
         Returns:
             Dict with types array and their constraints
         """
-        if self._types_cache is not None:
+        now = time.monotonic()
+        if self._types_cache is not None and now - self._types_cache[0] < self.cache_ttl:
             logger.debug("Returning cached diagram types")
-            return self._types_cache
+            return self._types_cache[1]
+
+        # Coalesce concurrent cache misses onto a single upstream request
+        if self._types_inflight is None:
+            self._types_inflight = asyncio.create_task(self._fetch_types())
+            self._types_inflight.add_done_callback(self._clear_types_inflight)
+        # Shield so one cancelled caller doesn't cancel the fetch for the rest
+        return await asyncio.shield(self._types_inflight)
+
+    def _clear_types_inflight(self, task: "asyncio.Task[Dict[str, Any]]"):
+        if self._types_inflight is task:
+            self._types_inflight = None
+
+    async def _fetch_types(self) -> Dict[str, Any]:
+        """Fetch diagram types from the service, falling back to stale or defaults."""
+        now = time.monotonic()
+
+        # Another worker may already have fetched them
+        shared = await shared_cache.get("diagram:types")
+        if shared is not None:
+            logger.debug("Returning diagram types from shared cache")
+            self._types_cache = (now, shared)
+            return shared
 
         logger.info("Fetching diagram types from service")
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(f"{self.base_url}/api/ai/diagram/types")
-                response.raise_for_status()
-                self._types_cache = response.json()
-                return self._types_cache
+            client = self._get_client()
+            response = await client.get("/api/ai/diagram/types", timeout=10)
+            response.raise_for_status()
+            types = orjson.loads(response.content)
+            self._types_cache = (time.monotonic(), types)
+            await shared_cache.set("diagram:types", types, self.cache_ttl)
+            return types
 
         except Exception as e:
             logger.error(f"Failed to fetch diagram types: {e}")
+            # Serve last known good types while within the stale window
+            if self._types_cache is not None and now - self._types_cache[0] < self.cache_stale_ttl:
+                logger.warning("Serving stale diagram types")
+                return {**self._types_cache[1], "_stale": True}
             # Return default types if service is unavailable
             return {
                 "success": True,
@@ -475,11 +716,14 @@ class DiagramService:
                 "_fallback": True
             }
 
-    def clear_cache(self):
-        """Clear cached diagram types"""
+    async def clear_cache(self):
+        """Clear cached diagram types, here and in the shared cache"""
         self._types_cache = None
+        # Don't hand a fetch started before the clear to later callers
+        self._types_inflight = None
+        await shared_cache.delete("diagram:types")
         logger.info("Diagram service cache cleared")
 
-    def get_min_size(self, diagram_type: str) -> Dict[str, int]:
-        """Get minimum grid size for a diagram type"""
-        return DIAGRAM_MIN_SIZES.get(diagram_type, {"width": 3, "height": 3})
+    def get_min_size(self, diagram_type: str) -> Mapping[str, int]:
+        """Get minimum grid size for a diagram type (read-only)"""
+        return DIAGRAM_MIN_SIZES.get(diagram_type, _DEFAULT_MIN_SIZE)
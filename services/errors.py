@@ -0,0 +1,170 @@
+"""
+Error mapping for AI service clients
+
+Service calls return error dicts instead of raising:
+
+    {"success": False, "error": {"code": ..., "message": ..., "retryable": ...}}
+
+service_error maps an httpx exception to that shape. The fixed "error"
+parts (TIMEOUT, CONNECTION_ERROR, HTTP_<status>) are built once and shared
+read-only, so an outage doesn't allocate them per request. wrap_service_errors
+applies it to every call of a service method, and drives the owning client's
+circuit breaker if it has one.
+"""
+
+import functools
+import logging
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional
+
+import httpx
+import orjson
+
+
+@functools.lru_cache(maxsize=256)
+def _http_error(service: str, status_code: int) -> Mapping[str, Any]:
+    """Read-only HTTP_<status> error for upstreams that send no error payload."""
+    return MappingProxyType({
+        "code": f"HTTP_{status_code}",
+        "message": f"{service} service returned status {status_code}",
+        "retryable": status_code >= 500
+    })
+
+
+@functools.lru_cache(maxsize=64)
+def _timeout_error(timeout_message: str) -> Mapping[str, Any]:
+    """Read-only TIMEOUT error."""
+    return MappingProxyType({
+        "code": "TIMEOUT",
+        "message": timeout_message,
+        "retryable": True
+    })
+
+
+@functools.lru_cache(maxsize=64)
+def _connection_error(service: str) -> Mapping[str, Any]:
+    """Read-only CONNECTION_ERROR error."""
+    return MappingProxyType({
+        "code": "CONNECTION_ERROR",
+        "message": f"Unable to connect to {service} AI service. Please try again later.",
+        "retryable": True
+    })
+
+
+def service_error(
+    exc: Exception,
+    service: str,
+    timeout_message: str,
+    action: str,
+    base_url: str,
+    element_id: Optional[str],
+    logger: logging.Logger,
+    breaker: Optional[Any] = None
+) -> Dict[str, Any]:
+    """
+    Map an exception from an upstream call to an error dict.
+
+    Call from inside the except block (unexpected errors are logged with
+    their traceback).
+
+    Args:
+        exc: The exception raised by the call
+        service: Service display name, e.g. "Text"
+        timeout_message: Message returned for TIMEOUT errors
+        action: What the call was doing, for unexpected-error logs
+        base_url: Upstream URL, for connection-error logs
+        element_id: Element the call was for, for logs
+        logger: Logger of the calling service module
+        breaker: Optional CircuitBreaker to record the failure on
+
+    Returns:
+        {"success": False, "error": {...}} dict
+    """
+    if isinstance(exc, httpx.TimeoutException):
+        if breaker is not None:
+            breaker.record_failure()
+        logger.error("%s service timeout for element %s", service, element_id)
+        return {"success": False, "error": _timeout_error(timeout_message)}
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        if breaker is not None:
+            breaker.record_status(status_code)
+        logger.error("%s service HTTP error: %s", service, status_code)
+        # Pass the upstream's own error through untouched when it sent one
+        try:
+            error_data = orjson.loads(exc.response.content)
+        except orjson.JSONDecodeError:
+            error_data = None
+        if isinstance(error_data, dict) and error_data.get("error"):
+            return {"success": False, "error": error_data["error"]}
+        return {"success": False, "error": _http_error(service, status_code)}
+
+    if isinstance(exc, httpx.ConnectError):
+        if breaker is not None:
+            breaker.record_failure()
+        logger.error("Failed to connect to %s service at %s", service, base_url)
+        return {"success": False, "error": _connection_error(service)}
+
+    if breaker is not None:
+        if isinstance(exc, httpx.TransportError):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+    logger.exception("Unexpected error in %s: %s", action, exc)
+    return {
+        "success": False,
+        "error": {
+            "code": "INTERNAL_ERROR",
+            "message": str(exc),
+            "retryable": False
+        }
+    }
+
+
+def wrap_service_errors(
+    service: str,
+    timeout_message: str,
+    action: str
+) -> Callable[[Callable[..., Awaitable[Dict[str, Any]]]], Callable[..., Awaitable[Dict[str, Any]]]]:
+    """
+    Decorate an async service method so upstream failures become error dicts.
+
+    If the instance has a `_breaker` (CircuitBreaker), requests are rejected
+    with CIRCUIT_OPEN while it is open, and each outcome is recorded on it.
+
+    Args:
+        service: Service display name, e.g. "Diagram"
+        timeout_message: Message returned for TIMEOUT errors
+        action: What the method does, for unexpected-error logs
+            (e.g. "diagram job submission")
+
+    Returns:
+        Decorator for methods returning a result dict
+    """
+    def decorator(fn: Callable[..., Awaitable[Dict[str, Any]]]) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        logger = logging.getLogger(fn.__module__)
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs) -> Dict[str, Any]:
+            breaker = getattr(self, "_breaker", None)
+            element_id = kwargs.get("element_id")
+
+            if breaker is not None and not breaker.allow():
+                logger.warning("%s circuit open, rejecting request for element %s", service, element_id)
+                return breaker.open_error()
+
+            try:
+                result = await fn(self, *args, **kwargs)
+            except Exception as e:
+                return service_error(
+                    e, service, timeout_message, action, self.base_url, element_id, logger, breaker
+                )
+
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+        return wrapper
+
+    return decorator
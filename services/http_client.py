@@ -0,0 +1,127 @@
+"""
+Shared HTTP client construction for AI service clients
+
+Each service client keeps one long-lived httpx.AsyncClient per upstream so
+keep-alive connections are reused across calls instead of paying a TCP/TLS
+handshake per request. HTTP/2 lets concurrent calls (e.g. many diagram polls
+or image generations for one deck) multiplex over a single connection.
+
+Responses are compressed when the upstream supports it: httpx advertises
+every Accept-Encoding it can decode (gzip, deflate, plus br and zstd once
+the brotli and zstandard packages from httpx[brotli,zstd] are installed)
+and decompresses transparently. Large Layout Service presentations and
+generated text/table HTML shrink several times on the wire. Don't set
+Accept-Encoding by hand; advertising an encoding without its decoder
+installed makes responses undecodable. The encoding each upstream chose is
+logged once, on its first response.
+"""
+
+import logging
+from typing import Dict, Optional, Set, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it httpx refuses
+# to build an http2 client, so fall back to pooled HTTP/1.1 instead of failing
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+    logger.warning("h2 is not installed; AI service clients will use HTTP/1.1")
+
+# Connection pool sizing shared by all service clients
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0
+)
+
+# Headers for request bodies pre-serialized with orjson (content=...)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Upstreams (host, port) whose response Content-Encoding has been logged
+_encoding_logged: Set[Tuple[str, Optional[int]]] = set()
+
+
+async def _log_response(response: httpx.Response):
+    """
+    Response hook: each upstream's Content-Encoding once, then one debug
+    line per call, formatted only when enabled
+    """
+    url = response.request.url
+    upstream = (url.host, url.port)
+    if upstream not in _encoding_logged:
+        _encoding_logged.add(upstream)
+        logger.info(
+            "%s responses use Content-Encoding: %s",
+            url.netloc.decode("ascii"), response.headers.get("content-encoding", "identity")
+        )
+    if logger.isEnabledFor(logging.DEBUG):
+        request = response.request
+        logger.debug(
+            "%s %s -> %d (%s)",
+            request.method, request.url, response.status_code, response.http_version
+        )
+
+
+def create_client(
+    base_url: str,
+    timeout: float,
+    limits: httpx.Limits = DEFAULT_LIMITS,
+    http2_prior_knowledge: bool = False,
+    transport: Optional[httpx.AsyncBaseTransport] = None
+) -> httpx.AsyncClient:
+    """
+    Create a pooled HTTP/2 client bound to a service base URL.
+
+    Falls back to HTTP/1.1 when h2 is not installed. The negotiated version
+    is logged per response at DEBUG level.
+
+    Args:
+        base_url: Service root URL; requests use paths relative to it
+        timeout: Default request timeout in seconds
+        limits: Connection pool limits
+        http2_prior_knowledge: Use HTTP/2 without negotiation. Over plain
+            http:// httpx otherwise always speaks HTTP/1.1; only enable this
+            for upstreams known to accept h2c
+        transport: Custom transport to send requests through (default:
+            httpx's pooled connection transport, configured by the
+            arguments above). A custom transport manages its own pool.
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    prior_knowledge = http2_prior_knowledge and HTTP2_AVAILABLE
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        limits=limits,
+        http1=not prior_knowledge,
+        http2=HTTP2_AVAILABLE,
+        event_hooks={"response": [_log_response]},
+        transport=transport
+    )
+
+
+# Clients shared by service classes that talk to the same upstream
+_shared_clients: Dict[Tuple[str, float], httpx.AsyncClient] = {}
+
+
+def shared_client(base_url: str, timeout: float) -> httpx.AsyncClient:
+    """
+    Get the process-wide client for (base_url, timeout), creating it on first use.
+
+    Services on the same origin (e.g. text and table, both served by Text
+    Table Builder) then share one pool, so their concurrent calls multiplex
+    over the same HTTP/2 connection instead of each opening their own.
+    Closing it (aclose) closes it for every user; the next call creates a
+    new one.
+    """
+    key = (base_url, timeout)
+    client = _shared_clients.get(key)
+    if client is None or client.is_closed:
+        client = _shared_clients[key] = create_client(base_url, timeout)
+    return client
@@ -9,12 +9,23 @@ Endpoints:
     - GET /api/ai/image/credits/{presentationId} - Check credits
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, Optional
+import time
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
 from config import settings
+from services.concurrency import gather_bounded
+from services.errors import wrap_service_errors
+from services.http_client import JSON_HEADERS, create_client
+from services.resilience import CircuitBreaker
+from services.shared_cache import shared_cache
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +38,13 @@ IMAGE_QUALITY_CREDITS = {
     "ultra": {"resolution": 2048, "credits": 8}
 }
 
+# Context fields forwarded to the backend only when set
+OPTIONAL_CONTEXT_FIELDS = ("presentationTheme", "slideTitle", "brandColors")
+
+# Flat quality -> credits lookup for get_credit_cost
+_CREDIT_COST = {quality: tier["credits"] for quality, tier in IMAGE_QUALITY_CREDITS.items()}
+_DEFAULT_CREDIT = _CREDIT_COST["standard"]
+
 # Image styles with descriptions
 IMAGE_STYLES = {
     "realistic": {
@@ -57,12 +75,39 @@ IMAGE_STYLES = {
 }
 
 
+def _generation_key(
+    prompt: str,
+    style: str,
+    quality: str,
+    aspect_ratio: str,
+    negative_prompt: Optional[str],
+    seed: Optional[int],
+    presentation_id: str,
+    constraints: Dict[str, int]
+) -> str:
+    """Stable hash of the inputs that determine a generated image (incl. its grid size)."""
+    payload = orjson.dumps(
+        {
+            "p": prompt,
+            "s": style,
+            "q": quality,
+            "a": aspect_ratio,
+            "n": negative_prompt,
+            "seed": seed,
+            "pid": presentation_id,
+            "c": constraints
+        },
+        option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 class ImageService:
     """
     Client for the Image AI Service.
 
     Features:
-        - Async HTTP calls with configurable timeout
+        - Async HTTP calls over a shared pooled HTTP/2 client
         - Credits tracking per presentation
         - Support for multiple image styles and quality tiers
         - Response caching for styles
@@ -72,7 +117,32 @@ class ImageService:
     def __init__(self):
         self.base_url = settings.IMAGE_SERVICE_URL
         self.timeout = settings.IMAGE_TIMEOUT
-        self._styles_cache: Optional[Dict[str, Any]] = None
+        self.cache_ttl = settings.CACHE_TTL
+        self.cache_stale_ttl = settings.CACHE_STALE_TTL
+        self.credits_cache_ttl = settings.CREDITS_CACHE_TTL
+        self._styles_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._styles_inflight: Optional["asyncio.Task[Dict[str, Any]]"] = None
+        self._generate_inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self.result_cache_ttl = settings.IMAGE_RESULT_CACHE_TTL
+        self._result_cache: TTLCache = TTLCache(maxsize=128, ttl=self.result_cache_ttl)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._breaker = CircuitBreaker(
+            "Image service",
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            cooldown=settings.CIRCUIT_COOLDOWN
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = create_client(self.base_url, self.timeout)
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def generate(
         self,
@@ -86,11 +156,19 @@ class ImageService:
         quality: str = "standard",
         aspect_ratio: str = "16:9",
         negative_prompt: Optional[str] = None,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        no_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Generate an image via Image AI Service.
 
+        Concurrent calls with the same prompt, settings, grid size and
+        presentation share one upstream request (and one credit charge); each
+        caller gets its own copy of the result. Successful results for
+        seeded requests are deterministic, so they are cached for
+        IMAGE_RESULT_CACHE_TTL seconds and served (flagged "_cached") without
+        calling upstream.
+
         Args:
             prompt: Description of the image
             presentation_id: Presentation identifier
@@ -103,10 +181,78 @@ class ImageService:
             aspect_ratio: Aspect ratio (16:9, 4:3, 1:1, 9:16, 21:9)
             negative_prompt: What to avoid in the image
             seed: Random seed for reproducibility
+            no_cache: Skip the result cache and always generate a new image
 
         Returns:
             Dict with success status and either image_url/image_base64 or error details
         """
+        key = _generation_key(
+            prompt, style, quality, aspect_ratio, negative_prompt, seed, presentation_id, constraints
+        )
+        cacheable = seed is not None and not no_cache
+
+        if cacheable:
+            cached = self._result_cache.get(key)
+            if cached is None:
+                cached = await shared_cache.get(f"image:result:{key}")
+                if cached is not None:
+                    self._result_cache[key] = cached
+            if cached is not None:
+                logger.info("Returning cached image for element %s", element_id)
+                return {**cached, "_cached": True}
+
+        task = self._generate_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._generate_and_store(
+                key,
+                cacheable,
+                prompt=prompt,
+                presentation_id=presentation_id,
+                slide_id=slide_id,
+                element_id=element_id,
+                context=context,
+                constraints=constraints,
+                style=style,
+                quality=quality,
+                aspect_ratio=aspect_ratio,
+                negative_prompt=negative_prompt,
+                seed=seed
+            ))
+            self._generate_inflight[key] = task
+            task.add_done_callback(partial(self._clear_generate_inflight, key))
+        else:
+            logger.info("Coalescing duplicate image generation for element %s", element_id)
+        # Shield so one cancelled caller doesn't cancel the generation for the rest
+        return {**await asyncio.shield(task)}
+
+    def _clear_generate_inflight(self, key: str, task: "asyncio.Task[Dict[str, Any]]"):
+        if self._generate_inflight.get(key) is task:
+            del self._generate_inflight[key]
+
+    async def _generate_and_store(self, key: str, cacheable: bool, **request: Any) -> Dict[str, Any]:
+        """Run _generate and cache a successful result when allowed."""
+        result = await self._generate(**request)
+        if cacheable and result.get("success"):
+            self._result_cache[key] = result
+            await shared_cache.set(f"image:result:{key}", result, self.result_cache_ttl)
+        return result
+
+    @wrap_service_errors("Image", "Image generation timed out. Please try again.", "image generation")
+    async def _generate(
+        self,
+        prompt: str,
+        presentation_id: str,
+        slide_id: str,
+        element_id: str,
+        context: Dict[str, Any],
+        constraints: Dict[str, int],
+        style: str = "realistic",
+        quality: str = "standard",
+        aspect_ratio: str = "16:9",
+        negative_prompt: Optional[str] = None,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Send one generation request (see generate)."""
         # Build context object matching backend LayoutImageContext schema
         # Required fields: presentationTitle, slideIndex
         backend_context = {
@@ -114,12 +260,10 @@ class ImageService:
             "slideIndex": context.get("slideIndex", 0),
         }
         # Optional context fields
-        if context.get("presentationTheme"):
-            backend_context["presentationTheme"] = context["presentationTheme"]
-        if context.get("slideTitle"):
-            backend_context["slideTitle"] = context["slideTitle"]
-        if context.get("brandColors"):
-            backend_context["brandColors"] = context["brandColors"]
+        for key in OPTIONAL_CONTEXT_FIELDS:
+            value = context.get(key)
+            if value:
+                backend_context[key] = value
 
         # Build config object matching backend LayoutImageConfig schema
         config = {
@@ -148,99 +292,97 @@ class ImageService:
         if options:
             request_body["options"] = options
 
-        logger.info(f"Generating image: style={style}, quality={quality}, element={element_id}")
-        logger.debug(f"Request body: {request_body}")
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/ai/image/generate",
-                    json=request_body
-                )
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Image generated successfully: {element_id}")
-                return result
-
-        except httpx.TimeoutException:
-            logger.error(f"Image service timeout for element {element_id}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "TIMEOUT",
-                    "message": "Image generation timed out. Please try again.",
-                    "retryable": True
-                }
-            }
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Image service HTTP error: {e.response.status_code}")
-            try:
-                error_data = e.response.json()
-                return {
-                    "success": False,
-                    "error": error_data.get("error", {
-                        "code": f"HTTP_{e.response.status_code}",
-                        "message": str(e),
-                        "retryable": e.response.status_code >= 500
-                    })
-                }
-            except Exception:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": f"HTTP_{e.response.status_code}",
-                        "message": f"Image service returned status {e.response.status_code}",
-                        "retryable": e.response.status_code >= 500
-                    }
-                }
+        logger.info("Generating image: style=%s, quality=%s, element=%s", style, quality, element_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body: %s", request_body)
+
+        client = self._get_client()
+        response = await client.post(
+            "/api/ai/image/generate",
+            content=orjson.dumps(request_body),
+            headers=JSON_HEADERS
+        )
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        logger.info("Image generated successfully: %s", element_id)
+        return result
+
+    async def generate_many(
+        self,
+        jobs: List[Dict[str, Any]],
+        concurrency: int = 8
+    ) -> List[Any]:
+        """
+        Generate several images concurrently.
 
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Image service at {self.base_url}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "CONNECTION_ERROR",
-                    "message": "Unable to connect to Image AI service. Please try again later.",
-                    "retryable": True
-                }
-            }
+        Args:
+            jobs: Keyword-argument dicts, one per generate call
+            concurrency: Maximum requests in flight at once (default 8)
 
-        except Exception as e:
-            logger.exception(f"Unexpected error in image generation: {e}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": str(e),
-                    "retryable": False
-                }
-            }
+        Returns:
+            Results in job order; a job that raised yields its exception
+        """
+        logger.info("Generating %d images (concurrency %d)", len(jobs), concurrency)
+        return await gather_bounded(
+            (partial(self.generate, **job) for job in jobs),
+            concurrency=concurrency
+        )
 
     async def get_styles(self) -> Dict[str, Any]:
         """
         Get available image styles.
 
-        Results are cached after first successful call.
+        Results are cached for CACHE_TTL seconds. If a refresh fails, the last
+        successful response is served (flagged "_stale") for up to
+        CACHE_STALE_TTL seconds before falling back to built-in defaults.
 
         Returns:
             Dict with styles array and their descriptions
         """
-        if self._styles_cache is not None:
+        now = time.monotonic()
+        if self._styles_cache is not None and now - self._styles_cache[0] < self.cache_ttl:
             logger.debug("Returning cached image styles")
-            return self._styles_cache
+            return self._styles_cache[1]
+
+        # Coalesce concurrent cache misses onto a single upstream request
+        if self._styles_inflight is None:
+            self._styles_inflight = asyncio.create_task(self._fetch_styles())
+            self._styles_inflight.add_done_callback(self._clear_styles_inflight)
+        # Shield so one cancelled caller doesn't cancel the fetch for the rest
+        return await asyncio.shield(self._styles_inflight)
+
+    def _clear_styles_inflight(self, task: "asyncio.Task[Dict[str, Any]]"):
+        if self._styles_inflight is task:
+            self._styles_inflight = None
+
+    async def _fetch_styles(self) -> Dict[str, Any]:
+        """Fetch image styles from the service, falling back to stale or defaults."""
+        now = time.monotonic()
+
+        # Another worker may already have fetched them
+        shared = await shared_cache.get("image:styles")
+        if shared is not None:
+            logger.debug("Returning image styles from shared cache")
+            self._styles_cache = (now, shared)
+            return shared
 
         logger.info("Fetching image styles from service")
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(f"{self.base_url}/api/ai/image/styles")
-                response.raise_for_status()
-                self._styles_cache = response.json()
-                return self._styles_cache
+            client = self._get_client()
+            response = await client.get("/api/ai/image/styles", timeout=10)
+            response.raise_for_status()
+            styles = orjson.loads(response.content)
+            self._styles_cache = (time.monotonic(), styles)
+            await shared_cache.set("image:styles", styles, self.cache_ttl)
+            return styles
 
         except Exception as e:
             logger.error(f"Failed to fetch image styles: {e}")
+            # Serve last known good styles while within the stale window
+            if self._styles_cache is not None and now - self._styles_cache[0] < self.cache_stale_ttl:
+                logger.warning("Serving stale image styles")
+                return {**self._styles_cache[1], "_stale": True}
             # Return default styles if service is unavailable
             return {
                 "success": True,
@@ -277,15 +419,24 @@ class ImageService:
         Returns:
             Dict with used, remaining, and total credits
         """
-        logger.info(f"Fetching image credits for presentation {presentation_id}")
+        cache_key = f"image:credits:{presentation_id}"
+        cached = await shared_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Returning cached image credits for presentation %s", presentation_id)
+            return cached
+
+        logger.info("Fetching image credits for presentation %s", presentation_id)
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/ai/image/credits/{presentation_id}"
-                )
-                response.raise_for_status()
-                return response.json()
+            client = self._get_client()
+            response = await client.get(
+                f"/api/ai/image/credits/{presentation_id}",
+                timeout=10
+            )
+            response.raise_for_status()
+            credits = orjson.loads(response.content)
+            await shared_cache.set(cache_key, credits, self.credits_cache_ttl)
+            return credits
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -334,9 +485,14 @@ class ImageService:
         Returns:
             Credit cost for the quality tier
         """
-        return IMAGE_QUALITY_CREDITS.get(quality, IMAGE_QUALITY_CREDITS["standard"])["credits"]
+        return _CREDIT_COST.get(quality, _DEFAULT_CREDIT)
 
-    def clear_cache(self):
-        """Clear cached styles"""
+    async def clear_cache(self):
+        """Clear cached styles and generated images, here and in the shared cache"""
         self._styles_cache = None
+        # Don't hand a fetch started before the clear to later callers
+        self._styles_inflight = None
+        self._result_cache.clear()
+        await shared_cache.delete("image:styles")
+        await shared_cache.delete_prefix("image:result:")
         logger.info("Image service cache cleared")
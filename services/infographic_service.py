@@ -8,12 +8,24 @@ Endpoints:
     - GET /api/ai/illustrator/types - Get supported infographic types
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
 from config import settings
+from services.concurrency import AIMDLimiter
+from services.errors import wrap_service_errors
+from services.http_client import JSON_HEADERS, create_client
+from services.resilience import CircuitBreaker, backoff_delay, parse_retry_after
+from services.shared_cache import load_snapshot, save_snapshot, shared_cache
 
 logger = logging.getLogger(__name__)
 
@@ -166,22 +178,216 @@ INFOGRAPHIC_TYPES = {
     }
 }
 
+# Type entries are lookup-only; expose them read-only
+INFOGRAPHIC_TYPES = {key: MappingProxyType(value) for key, value in INFOGRAPHIC_TYPES.items()}
+
+# Minimum grid size per type, precomputed for get_min_size
+_MIN_SIZE = {
+    key: MappingProxyType({"width": value["minGridWidth"], "height": value["minGridHeight"]})
+    for key, value in INFOGRAPHIC_TYPES.items()
+}
+_DEFAULT_MIN_SIZE = MappingProxyType({"width": 6, "height": 4})
+
+# Context fields forwarded to the backend only when set
+OPTIONAL_CONTEXT_FIELDS = ("presentationTheme", "slideTitle", "brandColors", "industry")
+
+# Request body defaults; generate() copies these and overlays per-call values
+_STYLE_DEFAULTS = MappingProxyType({
+    "colorScheme": "professional",
+    "iconStyle": "outlined",
+    "density": "balanced",
+    "orientation": "auto"
+})
+_CONTENT_DEFAULTS = MappingProxyType({
+    "includeIcons": True,
+    "includeDescriptions": True,
+    "includeNumbers": False
+})
+
+# get_types response when the service is unavailable, built once at import.
+# Shared across calls, so treat it as read-only.
+FALLBACK_TYPES_PAYLOAD: Dict[str, Any] = {
+    "success": True,
+    "types": [
+        {
+            "type": key,
+            "name": value["name"],
+            "description": value["description"],
+            "generator": value["generator"],
+            "minGridWidth": value["minGridWidth"],
+            "minGridHeight": value["minGridHeight"],
+            "minItems": value["minItems"],
+            "maxItems": value["maxItems"],
+            "supportsIcons": value["supportsIcons"]
+        }
+        for key, value in INFOGRAPHIC_TYPES.items()
+    ],
+    "colorSchemes": [
+        "professional", "vibrant", "pastel",
+        "monochrome", "warm", "cool"
+    ],
+    "iconStyles": ["outlined", "filled", "duotone", "minimal"],
+    "_cached": False,
+    "_fallback": True
+}
+
+# Endpoint paths, relative to the client's base_url
+GENERATE_PATH = "/api/ai/illustrator/generate"
+GENERATE_BATCH_PATH = "/api/ai/illustrator/generate/batch"
+TYPES_PATH = "/api/ai/illustrator/types"
+
+# CACHE_DIR snapshot name for the types payload
+TYPES_SNAPSHOT = "infographic_types"
+
+# Generate retries for transient failures
+MAX_ATTEMPTS = 3
+RETRYABLE_STATUSES = (408, 429, 500, 502, 503, 504)
+RATE_LIMIT_STATUSES = (429, 503)  # May carry Retry-After
+RETRY_AFTER_CAP = 30.0  # Longer requested pauses are returned to the caller instead
+RETRY_BASE_DELAY = 0.5  # Backoff: base * 2**(attempt-1) plus up to base of jitter
+RETRY_MAX_DELAY = 8.0
+
+
+@lru_cache(maxsize=256)
+def _scale_grid(grid_width: int, grid_height: int) -> Tuple[int, int]:
+    """Scale a 12x8 grid size to the backend's 32x18 system (larger sizes are clamped)."""
+    if grid_width <= 12 and grid_height <= 8:
+        # Scale factor: 32/12 ≈ 2.67 for width, 18/8 = 2.25 for height
+        return min(32, int(grid_width * 32 / 12)), min(18, int(grid_height * 18 / 8))
+    return min(32, grid_width), min(18, grid_height)
+
+
+def _type_error(infographic_type: str, element_id: str) -> Optional[Dict[str, Any]]:
+    """Return an INVALID_TYPE error for an unknown infographic type, else None."""
+    if infographic_type in INFOGRAPHIC_TYPES:
+        return None
+    logger.warning("Rejecting unknown infographic type '%s' for element %s", infographic_type, element_id)
+    return {
+        "success": False,
+        "error": {
+            "code": "INVALID_TYPE",
+            "message": f"Unknown infographic type '{infographic_type}'",
+            "retryable": False
+        }
+    }
+
+
+def _build_request_body(
+    prompt: str,
+    infographic_type: str,
+    presentation_id: str,
+    slide_id: str,
+    element_id: str,
+    context: Dict[str, Any],
+    constraints: Dict[str, int],
+    color_scheme: str = "professional",
+    icon_style: str = "outlined",
+    item_count: Optional[int] = None
+) -> Dict[str, Any]:
+    """Build the Illustrator generate request body for a known infographic type (defaults as in generate())."""
+    type_info = INFOGRAPHIC_TYPES[infographic_type]
+
+    # Keep item_count within the type's limits so the backend doesn't reject it
+    if item_count is not None:
+        clamped = max(type_info["minItems"], min(type_info["maxItems"], item_count))
+        if clamped != item_count:
+            logger.info(
+                "Clamping item_count %d to %d for %s (allowed %d-%d)",
+                item_count, clamped, infographic_type, type_info["minItems"], type_info["maxItems"]
+            )
+            item_count = clamped
+
+    # Backend uses 'type' not 'infographicType'
+    # Backend uses 32x18 grid system - scale up from 12x8 if needed
+    scaled_width, scaled_height = _scale_grid(
+        constraints.get("gridWidth", 8),
+        constraints.get("gridHeight", 6)
+    )
+
+    # Build context object matching backend PresentationContext schema
+    backend_context = {
+        "presentationTitle": context.get("presentationTitle", "Untitled"),
+        "slideIndex": context.get("slideIndex", 0),
+    }
+    for key in OPTIONAL_CONTEXT_FIELDS:
+        value = context.get(key)
+        if value:
+            backend_context[key] = value
+
+    # Build contentOptions object matching backend ContentOptions schema
+    content_options = {**_CONTENT_DEFAULTS}
+    if item_count is not None:
+        content_options["itemCount"] = item_count
+
+    return {
+        "prompt": prompt,
+        "type": infographic_type,  # Backend uses 'type' not 'infographicType'
+        "presentationId": presentation_id,
+        "slideId": slide_id,
+        "elementId": element_id,
+        "context": backend_context,
+        "constraints": {"gridWidth": scaled_width, "gridHeight": scaled_height},
+        # StyleOptions schema
+        "style": {**_STYLE_DEFAULTS, "colorScheme": color_scheme, "iconStyle": icon_style},
+        "contentOptions": content_options
+    }
+
 
 class InfographicService:
     """
     Client for the Infographic AI Service (Illustrator).
 
     Features:
+        - Shared pooled HTTP/2 client (connections reused across calls)
         - Async HTTP calls with configurable timeout
         - Support for template (HTML) and SVG generators
         - Response caching for types
         - Error handling with retryable status
+        - Circuit breaker that fails fast while the service is down
     """
 
     def __init__(self):
         self.base_url = settings.INFOGRAPHIC_SERVICE_URL
         self.timeout = settings.SERVICE_TIMEOUT
-        self._types_cache: Optional[Dict[str, Any]] = None
+        self.cache_ttl = settings.CACHE_TTL
+        self.cache_stale_ttl = settings.CACHE_STALE_TTL
+        self._types_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._types_inflight: Optional["asyncio.Task[Dict[str, Any]]"] = None
+        self._generate_inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._result_cache: TTLCache = TTLCache(maxsize=512, ttl=settings.INFOGRAPHIC_RESULT_CACHE_TTL)
+        # Start warm from the last snapshot a previous process saved
+        snapshot = load_snapshot(TYPES_SNAPSHOT, self.cache_ttl)
+        if snapshot is not None:
+            age, types = snapshot
+            self._types_cache = (time.monotonic() - age, types)
+        self._client: Optional[httpx.AsyncClient] = None
+        # Monotonic time before which generate calls hold off (Retry-After)
+        self._not_before = 0.0
+        # Fail fast while the backend is down instead of waiting out timeouts
+        self._breaker = CircuitBreaker(
+            "Infographic service",
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            cooldown=settings.CIRCUIT_COOLDOWN
+        )
+        # Cleared if the backend turns out not to support batch generation
+        self._batch_supported = settings.INFOGRAPHIC_BATCH_ENABLED
+        # Concurrency adapts to backend capacity, capped at the configured max
+        self._limiter = AIMDLimiter(
+            maximum=settings.INFOGRAPHIC_MAX_CONCURRENCY,
+            target_latency=settings.INFOGRAPHIC_TARGET_LATENCY
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = create_client(self.base_url, self.timeout)
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def generate(
         self,
@@ -196,11 +402,16 @@ class InfographicService:
         icon_style: str = "outlined",
         item_count: Optional[int] = None,
         items: Optional[List[Dict[str, Any]]] = None,
-        generate_data: bool = False
+        generate_data: bool = False,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Generate an infographic via Illustrator AI Service.
 
+        Successful results are cached in-process for INFOGRAPHIC_RESULT_CACHE_TTL
+        seconds; an identical request within that window is served from the
+        cache (flagged "_cached") without calling upstream.
+
         Args:
             prompt: Description of the infographic
             infographic_type: Type of infographic (pyramid, timeline, etc.)
@@ -214,192 +425,316 @@ class InfographicService:
             item_count: Number of items to generate
             items: Pre-defined items with title, description, icon
             generate_data: Generate sample data if no items provided
+            use_cache: Serve a cached result if available (False forces a
+                fresh generation, which then replaces the cached entry)
 
         Returns:
             Dict with success status and either html_content/svg_content or error
         """
-        # Backend uses 'type' not 'infographicType'
-        # Backend uses 32x18 grid system - scale up from 12x8 if needed
-        grid_width = constraints.get("gridWidth", 8)
-        grid_height = constraints.get("gridHeight", 6)
-
-        # Scale grid from 12x8 to 32x18 system if values are small
-        if grid_width <= 12 and grid_height <= 8:
-            # Scale factor: 32/12 ≈ 2.67 for width, 18/8 = 2.25 for height
-            scaled_width = min(32, int(grid_width * 32 / 12))
-            scaled_height = min(18, int(grid_height * 18 / 8))
+        error = _type_error(infographic_type, element_id)
+        if error is not None:
+            return error
+
+        request_body = _build_request_body(
+            prompt, infographic_type, presentation_id, slide_id, element_id,
+            context, constraints, color_scheme, icon_style, item_count
+        )
+
+        logger.info("Generating infographic: type=%s, element=%s", infographic_type, element_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body: %s", request_body)
+
+        # Identical concurrent requests share one upstream call
+        body = orjson.dumps(request_body)
+        key = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+        if use_cache:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                logger.info("Returning cached infographic for element %s", element_id)
+                return {**cached, "_cached": True}
+
+        task = self._generate_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._send_generate(body, key, element_id=element_id))
+            self._generate_inflight[key] = task
+            task.add_done_callback(partial(self._clear_generate_inflight, key))
         else:
-            scaled_width = min(32, grid_width)
-            scaled_height = min(18, grid_height)
+            logger.info("Coalescing duplicate infographic generation for element %s", element_id)
+        # Shield so one cancelled caller doesn't cancel the generation for the rest
+        return await asyncio.shield(task)
 
-        backend_constraints = {
-            "gridWidth": scaled_width,
-            "gridHeight": scaled_height
-        }
+    def _clear_generate_inflight(self, key: str, task: "asyncio.Task[Dict[str, Any]]"):
+        if self._generate_inflight.get(key) is task:
+            del self._generate_inflight[key]
 
-        # Build context object matching backend PresentationContext schema
-        backend_context = {
-            "presentationTitle": context.get("presentationTitle", "Untitled"),
-            "slideIndex": context.get("slideIndex", 0),
-        }
-        if context.get("presentationTheme"):
-            backend_context["presentationTheme"] = context["presentationTheme"]
-        if context.get("slideTitle"):
-            backend_context["slideTitle"] = context["slideTitle"]
-        if context.get("brandColors"):
-            backend_context["brandColors"] = context["brandColors"]
-        if context.get("industry"):
-            backend_context["industry"] = context["industry"]
-
-        # Build style object matching backend StyleOptions schema
-        style_options = {
-            "colorScheme": color_scheme,
-            "iconStyle": icon_style,
-            "density": "balanced",
-            "orientation": "auto"
-        }
+    async def generate_batch(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate several infographics (e.g. every infographic on a slide).
 
-        # Build contentOptions object matching backend ContentOptions schema
-        content_options = {
-            "includeIcons": True,
-            "includeDescriptions": True,
-            "includeNumbers": False
-        }
-        if item_count is not None:
-            content_options["itemCount"] = item_count
-
-        request_body = {
-            "prompt": prompt,
-            "type": infographic_type,  # Backend uses 'type' not 'infographicType'
-            "presentationId": presentation_id,
-            "slideId": slide_id,
-            "elementId": element_id,
-            "context": backend_context,
-            "constraints": backend_constraints,
-            "style": style_options,
-            "contentOptions": content_options
-        }
+        With INFOGRAPHIC_BATCH_ENABLED, uncached items are sent to the backend
+        in one batch request and its results are matched back by position.
+        Otherwise, or once the backend answers 404/405 to a batch, each item
+        goes through generate() concurrently.
 
-        logger.info(f"Generating infographic: type={infographic_type}, element={element_id}")
-        logger.debug(f"Request body: {request_body}")
+        Args:
+            specs: Keyword-argument dicts, one per generate call
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/ai/illustrator/generate",
-                    json=request_body
-                )
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Infographic generated successfully: {element_id}")
-                return result
-
-        except httpx.TimeoutException:
-            logger.error(f"Infographic service timeout for element {element_id}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "TIMEOUT",
-                    "message": "Infographic generation timed out. Please try again.",
-                    "retryable": True
-                }
-            }
+        Returns:
+            Result dicts in spec order
+        """
+        if not self._batch_supported or len(specs) < 2:
+            return await self._gather_generate(specs)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(specs)
+        pending: List[Tuple[int, str, bytes]] = []  # (index, cache key, serialized body)
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Infographic service HTTP error: {e.response.status_code}")
+        for index, spec in enumerate(specs):
             try:
-                error_data = e.response.json()
-                return {
+                error = _type_error(spec["infographic_type"], spec["element_id"])
+                if error is not None:
+                    results[index] = error
+                    continue
+                spec_args = {k: v for k, v in spec.items() if k not in ("items", "generate_data", "use_cache")}
+                body = orjson.dumps(_build_request_body(**spec_args))
+            except Exception as e:
+                # A malformed spec fails only its own slot
+                logger.error("Invalid infographic batch item for element %s: %s", spec.get("element_id"), e)
+                results[index] = {
                     "success": False,
-                    "error": error_data.get("error", {
-                        "code": f"HTTP_{e.response.status_code}",
+                    "error": {
+                        "code": "INTERNAL_ERROR",
                         "message": str(e),
-                        "retryable": e.response.status_code >= 500
-                    })
+                        "retryable": False
+                    }
                 }
-            except Exception:
-                return {
+                continue
+            key = hashlib.blake2b(body, digest_size=16).hexdigest()
+            if spec.get("use_cache", True):
+                cached = self._result_cache.get(key)
+                if cached is not None:
+                    results[index] = {**cached, "_cached": True}
+                    continue
+            pending.append((index, key, body))
+
+        if pending:
+            element_ids = ",".join(specs[index]["element_id"] for index, _, _ in pending)
+            logger.info("Generating %d infographics in one batch: %s", len(pending), element_ids)
+            batch_body = b'{"items":[' + b",".join(body for _, _, body in pending) + b"]}"
+            batch = await self._send_batch(batch_body, element_id=element_ids)
+
+            if batch.get("_unsupported"):
+                logger.warning("Infographic service does not support batch generation; sending items individually")
+                self._batch_supported = False
+                fallback = await self._gather_generate([specs[index] for index, _, _ in pending])
+                for (index, _, _), result in zip(pending, fallback):
+                    results[index] = result
+            elif not batch.get("success") or len(batch.get("items") or ()) != len(pending):
+                if batch.get("success"):
+                    batch = {
+                        "success": False,
+                        "error": {
+                            "code": "INTERNAL_ERROR",
+                            "message": "Infographic batch response did not match the request",
+                            "retryable": True
+                        }
+                    }
+                # Separate copies, so a caller changing one slot's error can't affect the others
+                for index, _, _ in pending:
+                    result = dict(batch)
+                    if isinstance(result.get("error"), Mapping):
+                        result["error"] = dict(result["error"])
+                    results[index] = result
+            else:
+                for (index, key, _), result in zip(pending, batch["items"]):
+                    if result.get("success"):
+                        self._result_cache[key] = result
+                    results[index] = result
+
+        return results
+
+    async def _gather_generate(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run generate() for each spec concurrently.
+
+        Concurrency is bounded by the shared AIMD limiter. One failing item
+        never cancels the others: an exception is returned as an
+        INTERNAL_ERROR dict in that item's slot.
+        """
+        results = await asyncio.gather(*(self.generate(**spec) for spec in specs), return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                logger.error("Infographic generation failed for element %s: %s", specs[index].get("element_id"), result)
+                results[index] = {
                     "success": False,
                     "error": {
-                        "code": f"HTTP_{e.response.status_code}",
-                        "message": f"Infographic service returned status {e.response.status_code}",
-                        "retryable": e.response.status_code >= 500
+                        "code": "INTERNAL_ERROR",
+                        "message": str(result),
+                        "retryable": False
                     }
                 }
+        return results
 
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Infographic service at {self.base_url}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "CONNECTION_ERROR",
-                    "message": "Unable to connect to Infographic AI service. Please try again later.",
-                    "retryable": True
-                }
-            }
+    @wrap_service_errors("Infographic", "Infographic generation timed out. Please try again.", "infographic batch generation")
+    async def _send_batch(self, body: bytes, *, element_id: str) -> Dict[str, Any]:
+        """
+        POST a serialized batch request (no retries; the items are too costly to resend blindly).
 
-        except Exception as e:
-            logger.exception(f"Unexpected error in infographic generation: {e}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": str(e),
-                    "retryable": False
-                }
-            }
+        Returns:
+            Batch response dict with an "items" list, or {"_unsupported": True}
+            if the backend has no batch endpoint
+        """
+        client = self._get_client()
+        async with self._limiter:
+            response = await client.post(GENERATE_BATCH_PATH, content=body, headers=JSON_HEADERS)
+        # A batch legitimately takes longer than one item, so only overload adjusts the limit
+        if response.status_code == 429 or response.status_code >= 500:
+            self._limiter.record_overload()
+        if response.status_code in (404, 405):
+            return {"success": False, "_unsupported": True}
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    @wrap_service_errors("Infographic", "Infographic generation timed out. Please try again.", "infographic generation")
+    async def _send_generate(self, body: bytes, key: str, *, element_id: str) -> Dict[str, Any]:
+        """Send a serialized generate request and cache a successful result."""
+        response = await self._post_generate(body)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        if result.get("success"):
+            self._result_cache[key] = result
+        logger.info("Infographic generated successfully: %s", element_id)
+        return result
+
+    async def _post_generate(self, body: bytes) -> httpx.Response:
+        """
+        POST a serialized generate request, retrying transient failures.
+
+        Timeouts, connection errors and RETRYABLE_STATUSES responses are
+        retried up to MAX_ATTEMPTS in total with jittered exponential backoff.
+        A 429/503 carrying Retry-After (at most RETRY_AFTER_CAP seconds) waits
+        that long instead, and the pause applies to every other generate call
+        on this client so concurrent requests don't keep hitting a backend
+        that asked us to slow down. Other 4xx responses are never retried.
+
+        Returns:
+            The last upstream response (status not yet checked)
+
+        Raises:
+            httpx.TimeoutException, httpx.ConnectError: on the final attempt
+        """
+        client = self._get_client()
+        attempt = 0
+        while True:
+            attempt += 1
+            pause = self._not_before - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+            response = None
+            async with self._limiter:
+                started = time.monotonic()
+                try:
+                    response = await client.post(
+                        GENERATE_PATH,
+                        content=body,
+                        headers=JSON_HEADERS
+                    )
+                except (httpx.TimeoutException, httpx.ConnectError) as e:
+                    if isinstance(e, httpx.TimeoutException):
+                        self._limiter.record_overload()
+                    if attempt >= MAX_ATTEMPTS:
+                        raise
+                    reason = type(e).__name__
+                else:
+                    self._limiter.record_response(response.status_code, time.monotonic() - started)
+
+            if response is not None:
+                if response.status_code not in RETRYABLE_STATUSES or attempt >= MAX_ATTEMPTS:
+                    return response
+                reason = f"HTTP {response.status_code}"
+
+                if response.status_code in RATE_LIMIT_STATUSES:
+                    retry_after = parse_retry_after(response.headers.get("retry-after"))
+                    if retry_after is not None:
+                        if retry_after > RETRY_AFTER_CAP:
+                            return response
+                        self._not_before = max(self._not_before, time.monotonic() + retry_after)
+                        logger.warning(
+                            "Infographic service returned %s, retrying after %.1fs (attempt %d/%d)",
+                            reason, retry_after, attempt, MAX_ATTEMPTS
+                        )
+                        continue
+
+            delay = backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+            logger.warning(
+                "Infographic service %s, retrying in %.1fs (attempt %d/%d)",
+                reason, delay, attempt, MAX_ATTEMPTS
+            )
+            await asyncio.sleep(delay)
 
     async def get_types(self) -> Dict[str, Any]:
         """
         Get supported infographic types with their constraints.
 
-        Results are cached after first successful call.
+        Results are cached for CACHE_TTL seconds. If a refresh fails, the last
+        successful response is served (flagged "_stale") for up to
+        CACHE_STALE_TTL seconds before falling back to built-in defaults.
 
         Returns:
             Dict with types array and their constraints
         """
-        if self._types_cache is not None:
+        now = time.monotonic()
+        if self._types_cache is not None and now - self._types_cache[0] < self.cache_ttl:
             logger.debug("Returning cached infographic types")
-            return self._types_cache
+            return self._types_cache[1]
+
+        # Coalesce concurrent cache misses onto a single upstream request
+        if self._types_inflight is None:
+            self._types_inflight = asyncio.create_task(self._fetch_types())
+            self._types_inflight.add_done_callback(self._clear_types_inflight)
+        # Shield so one cancelled caller doesn't cancel the fetch for the rest
+        return await asyncio.shield(self._types_inflight)
+
+    def _clear_types_inflight(self, task: "asyncio.Task[Dict[str, Any]]"):
+        if self._types_inflight is task:
+            self._types_inflight = None
+
+    async def _fetch_types(self) -> Dict[str, Any]:
+        """Fetch infographic types from the service, falling back to stale or defaults."""
+        now = time.monotonic()
+
+        # Another worker may already have fetched them
+        shared = await shared_cache.get("infographic:types")
+        if shared is not None:
+            logger.debug("Returning infographic types from shared cache")
+            self._types_cache = (now, shared)
+            return shared
 
         logger.info("Fetching infographic types from service")
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(f"{self.base_url}/api/ai/illustrator/types")
-                response.raise_for_status()
-                self._types_cache = response.json()
-                return self._types_cache
+            client = self._get_client()
+            response = await client.get(TYPES_PATH, timeout=10)
+            response.raise_for_status()
+            types = orjson.loads(response.content)
+            self._types_cache = (time.monotonic(), types)
+            await shared_cache.set("infographic:types", types, self.cache_ttl)
+            await asyncio.to_thread(save_snapshot, TYPES_SNAPSHOT, types)
+            return types
 
         except Exception as e:
             logger.error(f"Failed to fetch infographic types: {e}")
+            # Serve last known good types while within the stale window
+            if self._types_cache is not None and now - self._types_cache[0] < self.cache_stale_ttl:
+                logger.warning("Serving stale infographic types")
+                return {**self._types_cache[1], "_stale": True}
             # Return default types if service is unavailable
-            return {
-                "success": True,
-                "types": [
-                    {
-                        "type": key,
-                        "name": value["name"],
-                        "description": value["description"],
-                        "generator": value["generator"],
-                        "minGridWidth": value["minGridWidth"],
-                        "minGridHeight": value["minGridHeight"],
-                        "minItems": value["minItems"],
-                        "maxItems": value["maxItems"],
-                        "supportsIcons": value["supportsIcons"]
-                    }
-                    for key, value in INFOGRAPHIC_TYPES.items()
-                ],
-                "colorSchemes": [
-                    "professional", "vibrant", "pastel",
-                    "monochrome", "warm", "cool"
-                ],
-                "iconStyles": ["outlined", "filled", "duotone", "minimal"],
-                "_cached": False,
-                "_fallback": True
-            }
-
-    def get_type_info(self, infographic_type: str) -> Optional[Dict[str, Any]]:
+            return FALLBACK_TYPES_PAYLOAD
+
+    def get_type_info(self, infographic_type: str) -> Optional[Mapping[str, Any]]:
         """
         Get information about a specific infographic type.
 
@@ -407,21 +742,19 @@ class InfographicService:
             infographic_type: Type of infographic
 
         Returns:
-            Dict with type info or None if not found
+            Read-only mapping with type info, or None if not found
         """
         return INFOGRAPHIC_TYPES.get(infographic_type)
 
-    def get_min_size(self, infographic_type: str) -> Dict[str, int]:
-        """Get minimum grid size for an infographic type"""
-        type_info = INFOGRAPHIC_TYPES.get(infographic_type)
-        if type_info:
-            return {
-                "width": type_info["minGridWidth"],
-                "height": type_info["minGridHeight"]
-            }
-        return {"width": 6, "height": 4}  # Default
-
-    def clear_cache(self):
-        """Clear cached types"""
+    def get_min_size(self, infographic_type: str) -> Mapping[str, int]:
+        """Get minimum grid size for an infographic type (read-only)"""
+        return _MIN_SIZE.get(infographic_type, _DEFAULT_MIN_SIZE)
+
+    async def clear_cache(self):
+        """Clear cached types and generated infographics, here and in the shared cache"""
         self._types_cache = None
+        # Don't hand a fetch started before the clear to later callers
+        self._types_inflight = None
+        self._result_cache.clear()
+        await shared_cache.delete("infographic:types")
         logger.info("Infographic service cache cleared")
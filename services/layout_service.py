@@ -13,52 +13,343 @@ Layout Service API (Port 8504):
     - PUT /api/presentations/{id}/slides/{index}/images/{id} - Update single image
     - PUT /api/presentations/{id}/slides/{index}/infographics/{id} - Update single infographic
     - PUT /api/presentations/{id}/slides/{index}/diagrams/{id} - Update single diagram
+    - POST /api/presentations/{id}/slides/{index}/images/{id}/binary - Upload raw image bytes (optional)
+
+Event loop: injections are many small concurrent requests, where event-loop
+overhead shows. Run under uvloop (installed by uvicorn[standard] on Linux and
+macOS, and picked by uvicorn's loop="auto", which main.py passes).
 """
 
+import asyncio
+import base64
+import binascii
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
+import orjson
+from cachetools import TTLCache
 
 from config import settings
+from services.http_client import JSON_HEADERS, create_client
+from services.resilience import backoff_delay
 
 logger = logging.getLogger(__name__)
 
 
+# Retries for transient Layout Service failures
+MAX_ATTEMPTS = 3
+RETRYABLE_STATUSES = (502, 503, 504)  # Gateway errors: the update was not applied
+IDEMPOTENT_METHODS = ("GET", "PUT")
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 2.0
+
+# Paths are relative to the shared client's base_url (LAYOUT_SERVICE_URL)
+PRESENTATIONS_PATH = "/api/presentations"
+HEALTH_PATH = "/health"
+
+# Seconds a health check result is reused
+HEALTH_CACHE_TTL = 2.0
+
+# Seconds to use slide updates after the per-element endpoints looked
+# missing, before trying them again. A bare 404 can also be an application
+# error (e.g. a missing slide), so one is never taken as permanent
+ELEMENT_ROUTES_RETRY = 300.0
+
+# Per-element endpoint path segment for each slide element array
+ELEMENT_ROUTES = {
+    "charts": "charts",
+    "text_boxes": "textboxes",
+    "images": "images",
+    "infographics": "infographics",
+    "diagrams": "diagrams",
+}
+
+# inject_<kind> methods: kind -> (slide element array, created_by attribution)
+INJECTORS = MappingProxyType({
+    "chart": ("charts", "orchestrator-chart"),
+    "diagram": ("diagrams", "orchestrator-diagram"),
+    "text": ("text_boxes", "orchestrator-text"),
+    "table": ("text_boxes", "orchestrator-table"),  # Tables are HTML in text boxes
+    "image": ("images", "orchestrator-image"),
+    "infographic": ("infographics", "orchestrator-infographic"),
+})
+
+# Seconds to collect element updates for the same slide into one GET+PUT
+BATCH_WINDOW = 0.005
+
+# Queued element update:
+# (element_type, element_id, content, position, created_by, result future)
+PendingUpdate = Tuple[
+    str, str, Dict[str, Any], Optional[Dict[str, str]], str, "asyncio.Future[Dict[str, Any]]"
+]
+
+
+def _presentation_path(presentation_id: str) -> str:
+    return f"{PRESENTATIONS_PATH}/{presentation_id}"
+
+
+def _slide_path(presentation_id: str, slide_index: int) -> str:
+    return f"{PRESENTATIONS_PATH}/{presentation_id}/slides/{slide_index}"
+
+
+def _present(**fields: Any) -> Dict[str, Any]:
+    """Keep only the fields that were provided (not None)."""
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+async def _error_result(message: str) -> Dict[str, Any]:
+    return {"success": False, "error": message}
+
+
+def _is_missing_route(response: httpx.Response) -> bool:
+    """True if the Layout Service doesn't implement the requested route at all."""
+    if response.status_code == 405:
+        return True
+    if response.status_code != 404:
+        return False
+    # The framework's unmatched-route 404 carries the bare default detail;
+    # application 404s (missing presentation/slide) say what was missing
+    try:
+        return orjson.loads(response.content) == {"detail": "Not Found"}
+    except orjson.JSONDecodeError:
+        return False
+
+
+def _index_elements(element_array: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Map element id -> position in the array (first occurrence wins)."""
+    id_index: Dict[str, int] = {}
+    for i, element in enumerate(element_array):
+        id_index.setdefault(element.get("id"), i)
+    return id_index
+
+
+def _merge_element(
+    element_array: List[Dict[str, Any]],
+    id_index: Dict[str, int],
+    element_id: str,
+    content: Dict[str, Any],
+    position: Optional[Dict[str, str]]
+):
+    """
+    Apply an element update in place, creating the element if missing.
+
+    Args:
+        element_array: The slide's array for the element's type
+        id_index: _index_elements(element_array), kept current for new elements
+        element_id: Element identifier
+        content: Content fields to update on the element
+        position: Optional grid position update
+    """
+    i = id_index.get(element_id)
+    if i is not None:
+        # Update the element with new content
+        element = element_array[i]
+        element.update(content)
+        if position:
+            element["position"] = position
+        return
+
+    # Element doesn't exist - need to create it
+    logger.info("Element %s not found, will create new element", element_id)
+    new_element = {
+        "id": element_id,
+        **content
+    }
+    if position:
+        new_element["position"] = position
+    id_index[element_id] = len(element_array)
+    element_array.append(new_element)
+
+
 class LayoutServiceClient:
     """
     Client for injecting AI-generated content into Layout Service presentations.
 
     Features:
-        - Direct element updates without frontend hop
+        - Shared pooled HTTP/2 client (connections reused across calls)
+        - Direct element updates without frontend hop (per-element endpoints,
+          falling back to whole-slide updates)
+        - Per-slide batching of concurrent element injections (one GET+PUT)
         - Support for all element types (text, chart, image, infographic, diagram)
+        - ETag revalidation of fetched presentations
         - Error handling with graceful fallbacks
         - Version tracking via created_by metadata
     """
 
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.base_url = settings.LAYOUT_SERVICE_URL
         self.timeout = settings.SERVICE_TIMEOUT
+        # Optional custom httpx transport (e.g. a platform-specific or test transport)
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        # presentation_id -> (etag, raw response body) for conditional GETs
+        self._presentation_cache: TTLCache = TTLCache(maxsize=64, ttl=settings.CACHE_TTL)
+        self._presentation_inflight: Dict[str, "asyncio.Task[Any]"] = {}
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Element updates waiting for their slide's next batch, and the
+        # latest flush task per (presentation_id, slide_index)
+        self._pending: Dict[Tuple[str, int], List[PendingUpdate]] = {}
+        self._flush_tasks: Dict[Tuple[str, int], "asyncio.Task[None]"] = {}
+        # Monotonic time until which per-element endpoints are skipped, set
+        # when the Layout Service appears not to have them
+        self._element_routes_retry_at = 0.0
+        # Cleared once the Layout Service turns out not to accept binary image uploads
+        self._binary_uploads = settings.LAYOUT_BINARY_IMAGE_UPLOAD
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = create_client(
+                self.base_url,
+                self.timeout,
+                http2_prior_knowledge=settings.LAYOUT_HTTP2_PRIOR_KNOWLEDGE,
+                transport=self._transport
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "LayoutServiceClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _send(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request on the shared client, retrying transient failures.
+
+        Connection failures are retried for any method, because nothing
+        reached the server. 502/503/504 responses are retried only for
+        idempotent methods (GET, PUT). Up to MAX_ATTEMPTS in total, with
+        jittered exponential backoff.
+
+        Returns:
+            The last response (status not yet checked)
+
+        Raises:
+            httpx.ConnectError: on the final attempt
+        """
+        client = self._get_client()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await client.request(method, path, **kwargs)
+            except httpx.ConnectError:
+                if attempt >= MAX_ATTEMPTS:
+                    raise
+                reason = "connection failed"
+            else:
+                if (
+                    response.status_code not in RETRYABLE_STATUSES
+                    or method not in IDEMPOTENT_METHODS
+                    or attempt >= MAX_ATTEMPTS
+                ):
+                    return response
+                reason = f"HTTP {response.status_code}"
+
+            delay = backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+            logger.warning(
+                "Layout service %s %s: %s, retrying in %.1fs (attempt %d/%d)",
+                method, path, reason, delay, attempt, MAX_ATTEMPTS
+            )
+            await asyncio.sleep(delay)
+
+    def _err(self, exc: Exception, action: str) -> Dict[str, Any]:
+        """Map an exception raised while talking to the Layout Service to an error dict."""
+        if isinstance(exc, httpx.HTTPStatusError):
+            status_code = exc.response.status_code
+            logger.error("Layout service HTTP error: %s", status_code)
+            try:
+                detail = orjson.loads(exc.response.content).get("detail")
+            except (orjson.JSONDecodeError, AttributeError):
+                detail = None
+            return {
+                "success": False,
+                "error": detail or f"Layout service error: {status_code}"
+            }
+        if isinstance(exc, httpx.ConnectError):
+            logger.error("Failed to connect to Layout service at %s", self.base_url)
+            return {
+                "success": False,
+                "error": "Unable to connect to Layout service"
+            }
+        logger.exception("Unexpected error %s: %s", action, exc)
+        return {"success": False, "error": str(exc)}
 
     async def get_presentation(self, presentation_id: str) -> Dict[str, Any]:
         """
         Get a presentation by ID.
 
+        Concurrent calls for the same presentation share one GET. Responses
+        carrying an ETag are cached; later fetches send If-None-Match and
+        reuse the cached body on 304 Not Modified. Each call returns a
+        freshly parsed copy, so callers may modify it.
+
         Args:
             presentation_id: Presentation identifier
 
         Returns:
             Dict with presentation data or error
         """
+        # Concurrent callers share one in-flight GET
+        task = self._presentation_inflight.get(presentation_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_presentation(presentation_id))
+            self._presentation_inflight[presentation_id] = task
+            task.add_done_callback(partial(self._clear_presentation_inflight, presentation_id))
+        # Shield so one cancelled caller doesn't cancel the fetch for the rest
+        result = await asyncio.shield(task)
+        if isinstance(result, bytes):
+            # Parse per caller: the data is theirs to modify
+            return {"success": True, "data": orjson.loads(result)}
+        return result
+
+    def _clear_presentation_inflight(self, presentation_id: str, task: "asyncio.Task[Any]"):
+        if self._presentation_inflight.get(presentation_id) is task:
+            del self._presentation_inflight[presentation_id]
+
+    def _invalidate_presentation(self, presentation_id: str):
+        """Forget cached and in-flight reads of a presentation after it changed."""
+        self._presentation_cache.pop(presentation_id, None)
+        # Callers arriving from now on must not join a GET that predates the change
+        self._presentation_inflight.pop(presentation_id, None)
+
+    async def _fetch_presentation(self, presentation_id: str) -> Union[bytes, Dict[str, Any]]:
+        """
+        Fetch a presentation's raw JSON body, revalidating the ETag cache.
+
+        Returns:
+            The response body, or an error dict
+        """
         logger.debug(f"Fetching presentation {presentation_id}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/presentations/{presentation_id}"
-                )
-                response.raise_for_status()
-                return {"success": True, "data": response.json()}
+            cached = self._presentation_cache.get(presentation_id)
+            response = await self._send(
+                "GET",
+                _presentation_path(presentation_id),
+                headers={"If-None-Match": cached[0]} if cached else None
+            )
+            if cached and response.status_code == 304:
+                logger.debug("Presentation %s not modified, using cached copy", presentation_id)
+                return cached[1]
+            response.raise_for_status()
+            etag = response.headers.get("etag")
+            if etag:
+                self._presentation_cache[presentation_id] = (etag, response.content)
+            else:
+                self._presentation_cache.pop(presentation_id, None)
+            return response.content
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -66,22 +357,10 @@ class LayoutServiceClient:
                     "success": False,
                     "error": f"Presentation {presentation_id} not found"
                 }
-            logger.error(f"Layout service HTTP error: {e.response.status_code}")
-            return {
-                "success": False,
-                "error": f"Layout service error: {e.response.status_code}"
-            }
-
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Layout service at {self.base_url}")
-            return {
-                "success": False,
-                "error": "Unable to connect to Layout service"
-            }
+            return self._err(e, "fetching presentation")
 
         except Exception as e:
-            logger.exception(f"Unexpected error fetching presentation: {e}")
-            return {"success": False, "error": str(e)}
+            return self._err(e, "fetching presentation")
 
     async def get_slide(
         self,
@@ -136,42 +415,22 @@ class LayoutServiceClient:
         logger.debug(f"Updates: {list(updates.keys())}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Add created_by as query param
-                response = await client.put(
-                    f"{self.base_url}/api/presentations/{presentation_id}/slides/{slide_index}",
-                    json=updates,
-                    params={"created_by": created_by}
-                )
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Slide {slide_index} updated successfully")
-                return {"success": True, "data": result}
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Layout service HTTP error: {e.response.status_code}")
-            try:
-                error_data = e.response.json()
-                return {
-                    "success": False,
-                    "error": error_data.get("detail", str(e))
-                }
-            except Exception:
-                return {
-                    "success": False,
-                    "error": f"Layout service error: {e.response.status_code}"
-                }
-
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Layout service at {self.base_url}")
-            return {
-                "success": False,
-                "error": "Unable to connect to Layout service"
-            }
+            # Add created_by as query param
+            response = await self._send(
+                "PUT",
+                _slide_path(presentation_id, slide_index),
+                content=orjson.dumps(updates),
+                headers=JSON_HEADERS,
+                params={"created_by": created_by}
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            self._invalidate_presentation(presentation_id)
+            logger.info("Slide %s updated successfully", slide_index)
+            return {"success": True, "data": result}
 
         except Exception as e:
-            logger.exception(f"Unexpected error updating slide: {e}")
-            return {"success": False, "error": str(e)}
+            return self._err(e, "updating slide")
 
     async def update_element(
         self,
@@ -186,7 +445,9 @@ class LayoutServiceClient:
         """
         Update a specific element within a slide.
 
-        This method:
+        Uses the per-element endpoint, where the Layout Service finds or
+        creates the element itself. If that route isn't available, falls
+        back to:
         1. Fetches the current slide
         2. Finds the element by ID in the appropriate array
         3. Updates the element's content fields
@@ -206,37 +467,20 @@ class LayoutServiceClient:
         """
         logger.info(f"Updating {element_type} element {element_id} in slide {slide_index}")
 
+        result = await self._put_element(
+            presentation_id, slide_index, element_type, element_id, content, position, created_by
+        )
+        if result is not None:
+            return result
+
         # First, get the current slide
         slide_result = await self.get_slide(presentation_id, slide_index)
         if not slide_result["success"]:
             return slide_result
 
         slide = slide_result["data"]
-
-        # Get the element array for this type
         element_array = slide.get(element_type, [])
-
-        # Find the element by ID
-        element_found = False
-        for i, element in enumerate(element_array):
-            if element.get("id") == element_id:
-                # Update the element with new content
-                element_array[i].update(content)
-                if position:
-                    element_array[i]["position"] = position
-                element_found = True
-                break
-
-        if not element_found:
-            # Element doesn't exist - need to create it
-            logger.info(f"Element {element_id} not found, will create new element")
-            new_element = {
-                "id": element_id,
-                **content
-            }
-            if position:
-                new_element["position"] = position
-            element_array.append(new_element)
+        _merge_element(element_array, _index_elements(element_array), element_id, content, position)
 
         # Update the slide with the modified element array
         updates = {element_type: element_array}
@@ -248,6 +492,182 @@ class LayoutServiceClient:
             created_by=created_by
         )
 
+    async def _put_element(
+        self,
+        presentation_id: str,
+        slide_index: int,
+        element_type: str,
+        element_id: str,
+        content: Dict[str, Any],
+        position: Optional[Dict[str, str]],
+        created_by: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update one element through its per-element endpoint.
+
+        Only the element's fields are sent, and the Layout Service does the
+        find-or-create, so there is no slide GET and no lost-update race.
+
+        Returns:
+            Dict with success status and result or error, or None if the
+            endpoint isn't available (caller falls back to a slide update)
+        """
+        segment = ELEMENT_ROUTES.get(element_type)
+        if segment is None or time.monotonic() < self._element_routes_retry_at:
+            return None
+
+        body = {**content, "position": position} if position else content
+
+        try:
+            response = await self._send(
+                "PUT",
+                f"{_slide_path(presentation_id, slide_index)}/{segment}/{element_id}",
+                content=orjson.dumps(body),
+                headers=JSON_HEADERS,
+                params={"created_by": created_by}
+            )
+            if _is_missing_route(response):
+                logger.warning(
+                    "Layout service has no per-element endpoints; using slide updates for %.0fs",
+                    ELEMENT_ROUTES_RETRY
+                )
+                self._element_routes_retry_at = time.monotonic() + ELEMENT_ROUTES_RETRY
+                return None
+            response.raise_for_status()
+            self._invalidate_presentation(presentation_id)
+            logger.info("%s element %s updated successfully", element_type, element_id)
+            return {"success": True, "data": orjson.loads(response.content)}
+
+        except Exception as e:
+            return self._err(e, "updating element")
+
+    async def _enqueue(
+        self,
+        presentation_id: str,
+        slide_index: int,
+        element_type: str,
+        element_id: str,
+        content: Dict[str, Any],
+        position: Optional[Dict[str, str]],
+        created_by: str
+    ) -> Dict[str, Any]:
+        """
+        Apply an element update, batching it with others for the same slide
+        when the per-element endpoint is unavailable.
+
+        Updates for the same slide arriving within BATCH_WINDOW seconds are
+        applied together with one GET and one PUT (see _flush). Batches for
+        a slide are applied one after another, so concurrent injections can
+        no longer overwrite each other's element arrays.
+
+        Returns:
+            The per-element update result, or the update_slide result for
+            the batch (or the get_slide error)
+        """
+        result = await self._put_element(
+            presentation_id, slide_index, element_type, element_id, content, position, created_by
+        )
+        if result is not None:
+            return result
+
+        key = (presentation_id, slide_index)
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            task = asyncio.create_task(self._flush(key, batch, self._flush_tasks.get(key)))
+            self._flush_tasks[key] = task
+            task.add_done_callback(partial(self._clear_flush_task, key))
+        batch.append((element_type, element_id, content, position, created_by, future))
+
+        return await future
+
+    def _clear_flush_task(self, key: Tuple[str, int], task: "asyncio.Task[None]"):
+        if self._flush_tasks.get(key) is task:
+            del self._flush_tasks[key]
+
+    async def _flush(
+        self,
+        key: Tuple[str, int],
+        batch: List[PendingUpdate],
+        previous: Optional["asyncio.Task[None]"]
+    ):
+        """Apply a batch of queued element updates to one slide and resolve their futures."""
+        try:
+            await asyncio.sleep(BATCH_WINDOW)
+            # Close the batch; later updates start the next one
+            if self._pending.get(key) is batch:
+                del self._pending[key]
+            if previous is not None:
+                await asyncio.wait([previous])
+
+            presentation_id, slide_index = key
+            try:
+                result = await self._apply_updates(presentation_id, slide_index, batch)
+            except Exception as e:
+                logger.exception("Unexpected error applying batched updates to slide %s: %s", slide_index, e)
+                result = {"success": False, "error": str(e)}
+
+            for *_, future in batch:
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            if self._pending.get(key) is batch:
+                del self._pending[key]
+            for *_, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _apply_updates(
+        self,
+        presentation_id: str,
+        slide_index: int,
+        batch: List[PendingUpdate]
+    ) -> Dict[str, Any]:
+        """Merge a batch of element updates into the current slide and save it once."""
+        logger.info("Applying %d element update(s) to slide %s in presentation %s", len(batch), slide_index, presentation_id)
+
+        slide_result = await self.get_slide(presentation_id, slide_index)
+        if not slide_result["success"]:
+            return slide_result
+
+        slide = slide_result["data"]
+        # Index each touched element array once, then apply updates by id lookup
+        updates: Dict[str, List[Dict[str, Any]]] = {}
+        indexes: Dict[str, Dict[str, int]] = {}
+        for element_type, element_id, content, position, _, _ in batch:
+            if element_type not in updates:
+                updates[element_type] = slide.get(element_type, [])
+                indexes[element_type] = _index_elements(updates[element_type])
+            _merge_element(updates[element_type], indexes[element_type], element_id, content, position)
+
+        # One PUT carries one attribution; keep it when every update agrees
+        creators = {created_by for _, _, _, _, created_by, _ in batch}
+        created_by = creators.pop() if len(creators) == 1 else "orchestrator"
+
+        return await self.update_slide(
+            presentation_id=presentation_id,
+            slide_index=slide_index,
+            updates=updates,
+            created_by=created_by
+        )
+
+    async def _inject(
+        self,
+        kind: str,
+        presentation_id: str,
+        slide_index: int,
+        element_id: str,
+        content: Dict[str, Any],
+        position: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Apply an inject_<kind> update with that kind's element array and attribution."""
+        element_type, created_by = INJECTORS[kind]
+        return await self._enqueue(
+            presentation_id, slide_index, element_type, element_id, content, position, created_by
+        )
+
     async def inject_chart(
         self,
         presentation_id: str,
@@ -273,23 +693,9 @@ class LayoutServiceClient:
         Returns:
             Dict with success status and result
         """
-        content = {}
-        if chart_config is not None:
-            content["chart_config"] = chart_config
-        if chart_html is not None:
-            content["chart_html"] = chart_html
-        if chart_type is not None:
-            content["chart_type"] = chart_type
-
-        return await self.update_element(
-            presentation_id=presentation_id,
-            slide_index=slide_index,
-            element_type="charts",
-            element_id=element_id,
-            content=content,
-            position=position,
-            created_by="orchestrator-chart"
-        )
+        content = _present(chart_config=chart_config, chart_html=chart_html, chart_type=chart_type)
+
+        return await self._inject("chart", presentation_id, slide_index, element_id, content, position)
 
     async def inject_diagram(
         self,
@@ -316,23 +722,9 @@ class LayoutServiceClient:
         Returns:
             Dict with success status and result
         """
-        content = {}
-        if svg_content is not None:
-            content["svg_content"] = svg_content
-        if mermaid_code is not None:
-            content["mermaid_code"] = mermaid_code
-        if diagram_type is not None:
-            content["diagram_type"] = diagram_type
-
-        return await self.update_element(
-            presentation_id=presentation_id,
-            slide_index=slide_index,
-            element_type="diagrams",
-            element_id=element_id,
-            content=content,
-            position=position,
-            created_by="orchestrator-diagram"
-        )
+        content = _present(svg_content=svg_content, mermaid_code=mermaid_code, diagram_type=diagram_type)
+
+        return await self._inject("diagram", presentation_id, slide_index, element_id, content, position)
 
     async def inject_text(
         self,
@@ -355,14 +747,8 @@ class LayoutServiceClient:
         Returns:
             Dict with success status and result
         """
-        return await self.update_element(
-            presentation_id=presentation_id,
-            slide_index=slide_index,
-            element_type="text_boxes",
-            element_id=element_id,
-            content={"content": html_content},
-            position=position,
-            created_by="orchestrator-text"
+        return await self._inject(
+            "text", presentation_id, slide_index, element_id, {"content": html_content}, position
         )
 
     async def inject_table(
@@ -387,14 +773,8 @@ class LayoutServiceClient:
         Returns:
             Dict with success status and result
         """
-        return await self.update_element(
-            presentation_id=presentation_id,
-            slide_index=slide_index,
-            element_type="text_boxes",
-            element_id=element_id,
-            content={"content": html_content},
-            position=position,
-            created_by="orchestrator-table"
+        return await self._inject(
+            "table", presentation_id, slide_index, element_id, {"content": html_content}, position
         )
 
     async def inject_image(
@@ -423,6 +803,10 @@ class LayoutServiceClient:
             Dict with success status and result
         """
         content = {}
+        if image_url is None and image_base64 is not None and self._binary_uploads:
+            image_url = await self._upload_base64_image(
+                presentation_id, slide_index, element_id, image_base64
+            )
         if image_url is not None:
             content["image_url"] = image_url
         elif image_base64 is not None:
@@ -434,15 +818,79 @@ class LayoutServiceClient:
         if alt_text is not None:
             content["alt_text"] = alt_text
 
-        return await self.update_element(
-            presentation_id=presentation_id,
-            slide_index=slide_index,
-            element_type="images",
-            element_id=element_id,
-            content=content,
-            position=position,
-            created_by="orchestrator-image"
+        return await self._inject("image", presentation_id, slide_index, element_id, content, position)
+
+    async def upload_image_binary(
+        self,
+        presentation_id: str,
+        slide_index: int,
+        element_id: str,
+        raw_bytes: bytes,
+        content_type: str = "image/png"
+    ) -> Dict[str, Any]:
+        """
+        Upload raw image bytes for an image element.
+
+        Sending bytes avoids the base64 inflation (4/3x) and the JSON
+        escaping of an inline data URI.
+
+        Args:
+            presentation_id: Presentation identifier
+            slide_index: Zero-based slide index
+            element_id: Image element identifier
+            raw_bytes: Image file contents
+            content_type: Image MIME type
+
+        Returns:
+            Dict with success status and the stored image URL ("url") or error
+        """
+        try:
+            response = await self._send(
+                "POST",
+                f"{_slide_path(presentation_id, slide_index)}/images/{element_id}/binary",
+                content=raw_bytes,
+                headers={"Content-Type": content_type}
+            )
+            if _is_missing_route(response):
+                logger.warning("Layout service has no binary image upload endpoint; using data URIs")
+                self._binary_uploads = False
+                return {"success": False, "error": "Binary image upload not supported"}
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            url = data.get("url") or data.get("image_url")
+            if not url:
+                return {"success": False, "error": "Layout service returned no image URL"}
+            return {"success": True, "url": url}
+
+        except Exception as e:
+            return self._err(e, "uploading image")
+
+    async def _upload_base64_image(
+        self,
+        presentation_id: str,
+        slide_index: int,
+        element_id: str,
+        image_base64: str
+    ) -> Optional[str]:
+        """Decode a base64 image (or data URI) once and upload it; None means use a data URI."""
+        content_type = "image/png"
+        data = image_base64
+        if data.startswith("data:"):
+            header, _, data = data.partition(",")
+            content_type = header[5:].split(";", 1)[0] or content_type
+        try:
+            raw_bytes = base64.b64decode(data, validate=True)
+        except (binascii.Error, ValueError):
+            logger.warning("Image %s is not valid base64; storing it as a data URI", element_id)
+            return None
+
+        result = await self.upload_image_binary(
+            presentation_id, slide_index, element_id, raw_bytes, content_type
         )
+        if not result["success"]:
+            logger.warning("Binary upload failed for image %s: %s", element_id, result["error"])
+            return None
+        return result["url"]
 
     async def inject_infographic(
         self,
@@ -471,49 +919,92 @@ class LayoutServiceClient:
         Returns:
             Dict with success status and result
         """
-        content = {}
-        if svg_content is not None:
-            content["svg_content"] = svg_content
-        if html_content is not None:
+        content = _present(
             # Store HTML in svg_content field (Layout Service handles both)
-            content["svg_content"] = html_content
-        if infographic_type is not None:
-            content["infographic_type"] = infographic_type
-        if items is not None:
-            content["items"] = items
-
-        return await self.update_element(
-            presentation_id=presentation_id,
-            slide_index=slide_index,
-            element_type="infographics",
-            element_id=element_id,
-            content=content,
-            position=position,
-            created_by="orchestrator-infographic"
+            svg_content=html_content if html_content is not None else svg_content,
+            infographic_type=infographic_type,
+            items=items
         )
 
+        return await self._inject("infographic", presentation_id, slide_index, element_id, content, position)
+
+    async def inject_many(
+        self,
+        presentation_id: str,
+        slide_index: int,
+        ops: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Inject several elements into one slide concurrently.
+
+        All injections run at once. They either go through per-element
+        endpoints in parallel, or they land in the same slide batch and are
+        saved with one GET+PUT.
+
+        Args:
+            presentation_id: Presentation identifier
+            slide_index: Zero-based slide index
+            ops: One dict per element: "kind" (chart, diagram, text, table,
+                image, infographic) plus that inject_* method's keyword
+                arguments, e.g. {"kind": "text", "element_id": ..., "html_content": ...}
+
+        Returns:
+            Results in ops order; a failed injection yields an error dict
+        """
+        calls = []
+        for op in ops:
+            args = dict(op)
+            kind = args.pop("kind", None)
+            if kind not in INJECTORS:
+                calls.append(_error_result(f"Unknown element kind: {kind}"))
+                continue
+            inject = getattr(self, f"inject_{kind}")
+            try:
+                calls.append(inject(presentation_id=presentation_id, slide_index=slide_index, **args))
+            except TypeError as e:  # Missing or unexpected arguments for this kind
+                calls.append(_error_result(f"Invalid {kind} element: {e}"))
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                logger.error("Injection of %s element %s failed: %s", ops[index].get("kind"), ops[index].get("element_id"), result)
+                results[index] = {"success": False, "error": str(result)}
+        return results
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Check if Layout Service is available.
 
+        The result (healthy or not) is reused for HEALTH_CACHE_TTL seconds,
+        so frequent liveness probes don't each hit the Layout Service.
+
         Returns:
             Dict with health status
         """
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < HEALTH_CACHE_TTL:
+            return self._health_cache[1]
+
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(f"{self.base_url}/health")
-                response.raise_for_status()
-                return {"success": True, "status": "healthy", "url": self.base_url}
+            client = self._get_client()
+            response = await client.get(HEALTH_PATH, timeout=5)
+            response.raise_for_status()
+            result = {"success": True, "status": "healthy", "url": self.base_url}
 
         except Exception as e:
             logger.warning(f"Layout service health check failed: {e}")
-            return {
+            result = {
                 "success": False,
                 "status": "unhealthy",
                 "url": self.base_url,
                 "error": str(e)
             }
 
+        self._health_cache = (time.monotonic(), result)
+        return result
+
 
 # Singleton instance for use across routers
 layout_service = LayoutServiceClient()
@@ -0,0 +1,122 @@
+"""
+Resilience helpers for AI service clients
+
+CircuitBreaker stops a client from queueing requests against an upstream that
+is already failing: after a run of consecutive failures, calls fail fast for a
+cool-down period, then a single probe request decides whether to close again.
+
+backoff_delay and parse_retry_after decide how long to wait before retrying.
+"""
+
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    States:
+        - Closed: requests flow; failures are counted
+        - Open: requests are rejected until the cool-down elapses
+        - Half-open: one probe request is let through; its outcome closes
+          or re-opens the circuit
+
+    Only upstream unavailability (timeouts, connection errors, 5xx) should be
+    recorded as a failure; any other response proves the service is up.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, cooldown: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        # Shared read-only error for every rejected request
+        self._open_error = MappingProxyType({
+            "code": "CIRCUIT_OPEN",
+            "message": f"{name} is temporarily unavailable. Please try again later.",
+            "retryable": True
+        })
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self._consecutive_failures < self.failure_threshold:
+            return True
+        now = time.monotonic()
+        if now < self._open_until:
+            return False
+        # Cool-down elapsed: let a single probe through and keep rejecting
+        # others for another cool-down in case the probe never reports back
+        self._open_until = now + self.cooldown
+        return True
+
+    def record_success(self):
+        if self._consecutive_failures >= self.failure_threshold:
+            logger.info("%s circuit closed", self.name)
+        self._consecutive_failures = 0
+
+    def record_failure(self):
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.failure_threshold:
+            self._open_until = time.monotonic() + self.cooldown
+            logger.warning(
+                "%s circuit open for %ss after %d consecutive failures",
+                self.name, self.cooldown, self._consecutive_failures
+            )
+
+    def record_status(self, status_code: int):
+        """Record an HTTP error response; only 5xx counts as a failure."""
+        if status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def open_error(self) -> Dict[str, Any]:
+        """Error response returned while the circuit is open."""
+        return {"success": False, "error": self._open_error}
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 8.0) -> float:
+    """
+    Exponential backoff with jitter.
+
+    Args:
+        attempt: 1-based number of the attempt that just failed
+        base: Delay after the first failure, before jitter
+        cap: Upper bound on the exponential part
+
+    Returns:
+        min(cap, base * 2**(attempt - 1)) plus uniform jitter in [0, base]
+    """
+    return min(cap, base * (2 ** (attempt - 1))) + random.uniform(0, base)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds to wait.
+
+    Args:
+        value: Header value, either delay-seconds ("120") or an HTTP-date
+
+    Returns:
+        Non-negative seconds, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
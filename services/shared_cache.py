@@ -0,0 +1,173 @@
+"""
+Shared cross-process cache for AI service clients
+
+Service clients keep their own in-process caches (L1). This module adds an
+optional Redis-backed L2 so every uvicorn worker shares one warm cache and a
+restart doesn't re-fetch metadata from upstream. Configure Redis with an LFU
+eviction policy (maxmemory-policy allkeys-lfu).
+
+When REDIS_URL is unset or the redis package is not installed, reads miss
+and writes are no-ops. Redis errors are logged and treated as misses so the
+cache can never fail a request.
+
+load_snapshot/save_snapshot keep small payloads in CACHE_DIR so a restarted
+worker starts warm even without Redis.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Optional, Tuple
+
+import orjson
+
+from config import settings
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # Optional dependency
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+
+class SharedCache:
+    """
+    Minimal JSON key/value cache on top of Redis.
+
+    Features:
+        - Lazy connection on first use
+        - Per-key expiry (seconds)
+        - Fails open: errors behave like cache misses
+    """
+
+    def __init__(self, url: Optional[str] = None, prefix: str = "veo:"):
+        self.url = url
+        self.prefix = prefix
+        self._client = None
+        if url and redis_asyncio is None:
+            logger.warning("REDIS_URL is set but the redis package is not installed; shared cache disabled")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url) and redis_asyncio is not None
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = redis_asyncio.from_url(
+                self.url,
+                socket_timeout=0.5,
+                socket_connect_timeout=0.5
+            )
+        return self._client
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on miss/error."""
+        if not self.enabled:
+            return None
+        try:
+            raw = await self._get_client().get(self.prefix + key)
+        except Exception as e:
+            logger.warning("Shared cache read failed for %s: %s", key, e)
+            return None
+        if raw is None:
+            return None
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            logger.warning("Discarding undecodable shared cache entry %s", key)
+            return None
+
+    async def set(self, key: str, value: Any, ttl: float):
+        """Store a JSON-serializable value for ttl seconds."""
+        if not self.enabled:
+            return
+        try:
+            await self._get_client().set(self.prefix + key, orjson.dumps(value), ex=max(1, int(ttl)))
+        except Exception as e:
+            logger.warning("Shared cache write failed for %s: %s", key, e)
+
+    async def delete(self, *keys: str):
+        """Remove keys (no-op when disabled)."""
+        if not self.enabled or not keys:
+            return
+        try:
+            await self._get_client().delete(*(self.prefix + key for key in keys))
+        except Exception as e:
+            logger.warning("Shared cache delete failed for %s: %s", ",".join(keys), e)
+
+    async def delete_prefix(self, key_prefix: str):
+        """Remove every key starting with key_prefix (no-op when disabled)."""
+        if not self.enabled:
+            return
+        client = self._get_client()
+        try:
+            batch = []
+            async for key in client.scan_iter(match=f"{self.prefix}{key_prefix}*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await client.delete(*batch)
+                    batch.clear()
+            if batch:
+                await client.delete(*batch)
+        except Exception as e:
+            logger.warning("Shared cache delete failed for %s*: %s", key_prefix, e)
+
+    async def aclose(self):
+        """Close the Redis connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def _snapshot_path(name: str) -> Optional[str]:
+    if not settings.CACHE_DIR:
+        return None
+    return os.path.join(settings.CACHE_DIR, f"{name}.json")
+
+
+def load_snapshot(name: str, max_age: float) -> Optional[Tuple[float, Any]]:
+    """
+    Load a payload saved by save_snapshot if it is younger than max_age.
+
+    Args:
+        name: Snapshot name (file name without extension)
+        max_age: Maximum age in seconds
+
+    Returns:
+        (age_seconds, payload), or None if disabled, missing, expired or unreadable
+    """
+    path = _snapshot_path(name)
+    if path is None:
+        return None
+    try:
+        with open(path, "rb") as f:
+            snapshot = orjson.loads(f.read())
+        age = time.time() - snapshot["saved_at"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable cache snapshot %s: %s", path, e)
+        return None
+    if not 0 <= age < max_age:
+        return None
+    return age, snapshot["payload"]
+
+
+def save_snapshot(name: str, payload: Any):
+    """Atomically write a JSON-serializable payload to CACHE_DIR (no-op when unset)."""
+    path = _snapshot_path(name)
+    if path is None:
+        return
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(settings.CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps({"saved_at": time.time(), "payload": payload}))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning("Failed to write cache snapshot %s: %s", path, e)
+
+
+# Process-wide instance shared by all service clients
+shared_cache = SharedCache(settings.REDIS_URL)
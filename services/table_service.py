@@ -5,6 +5,7 @@ Handles communication with the Text Table Builder v1.2 Table endpoints.
 
 Endpoints:
     - POST /api/ai/table/generate - Generate table content
+    - POST /api/ai/table/batch - Generate several tables at once
     - POST /api/ai/table/transform - Transform existing table
     - POST /api/ai/table/analyze - Analyze table data
 """
@@ -12,12 +13,17 @@ Endpoints:
 import logging
 from typing import Any, Dict, List, Optional
 
-import httpx
-
 from config import settings
+from services.base_service import GENERATE_ATTEMPTS, BaseAIService, build_slide_context
 
 logger = logging.getLogger(__name__)
 
+# Endpoint paths, relative to the client's base_url
+GENERATE_PATH = "/api/ai/table/generate"
+GENERATE_BATCH_PATH = "/api/ai/table/batch"
+TRANSFORM_PATH = "/api/ai/table/transform"
+ANALYZE_PATH = "/api/ai/table/analyze"
+
 
 # Table presets with their descriptions
 TABLE_PRESETS = {
@@ -29,20 +35,83 @@ TABLE_PRESETS = {
     "colorful": "Vibrant colors for engagement"
 }
 
+# get_presets() response, built once; shared by every caller, so never mutate it
+_PRESETS_RESPONSE = {
+    "success": True,
+    "presets": tuple(
+        {"name": name, "description": desc}
+        for name, desc in TABLE_PRESETS.items()
+    ),
+    "defaultPreset": "professional"
+}
+
 
-class TableService:
+def _generate_body(
+    prompt: str,
+    presentation_id: str,
+    slide_id: str,
+    element_id: str,
+    context: Dict[str, Any],
+    constraints: Dict[str, int],
+    preset: str = "professional",
+    columns: Optional[int] = None,
+    rows: Optional[int] = None,
+    has_header: bool = True,
+    data: Optional[List[List[str]]] = None
+) -> Dict[str, Any]:
+    """Build a table generate request body (also one item of a batch)"""
+    request_body = {
+        "prompt": prompt,
+        "presentationId": presentation_id,
+        "slideId": slide_id,
+        "elementId": element_id,
+        "context": build_slide_context(context),
+        "constraints": constraints,
+    }
+
+    # Build structure object if columns/rows provided
+    if columns or rows or has_header is not None:
+        structure = {}
+        if columns:
+            structure["columns"] = columns
+        if rows:
+            structure["rows"] = rows
+        if has_header is not None:
+            structure["hasHeader"] = has_header
+        request_body["structure"] = structure
+
+    # Build style object with preset
+    request_body["style"] = {
+        "preset": preset
+    }
+
+    # Add seed data if provided
+    if data:
+        request_body["seedData"] = {"data": data}
+
+    return request_body
+
+
+class TableService(BaseAIService):
     """
     Client for the Table AI Service.
 
     Features:
+        - Shared pooled HTTP/2 client (connections reused across calls)
         - Async HTTP calls with configurable timeout
         - Support for table generation, transformation, and analysis
         - Error handling with retryable status
     """
 
+    service_name = "Table"
+
     def __init__(self):
-        self.base_url = settings.TEXT_TABLE_SERVICE_URL
-        self.timeout = settings.SERVICE_TIMEOUT
+        super().__init__(
+            settings.TEXT_TABLE_SERVICE_URL,
+            settings.SERVICE_TIMEOUT,
+            settings.TEXT_TABLE_BATCH_ENABLED,
+            result_cache_ttl=settings.TEXT_TABLE_RESULT_CACHE_TTL
+        )
 
     async def generate(
         self,
@@ -56,7 +125,8 @@ class TableService:
         columns: Optional[int] = None,
         rows: Optional[int] = None,
         has_header: bool = True,
-        data: Optional[List[List[str]]] = None
+        data: Optional[List[List[str]]] = None,
+        no_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Generate a table via Table AI Service.
@@ -73,120 +143,50 @@ class TableService:
             rows: Number of data rows (optional, AI will decide)
             has_header: Include header row (default True)
             data: Existing data as 2D array (optional)
+            no_cache: Always generate a new table instead of reusing a cached result
 
         Returns:
             Dict with success status and either html_content or error details
         """
-        # Build context object matching backend SlideContext schema
-        # Required fields: presentationTitle, slideIndex, slideCount
-        backend_context = {
-            "presentationTitle": context.get("presentationTitle", "Untitled"),
-            "slideIndex": context.get("slideIndex", 0),
-            "slideCount": context.get("slideCount", 1),
-        }
-        # Optional context fields
-        if context.get("presentationTheme"):
-            backend_context["presentationTheme"] = context["presentationTheme"]
-        if context.get("slideTitle"):
-            backend_context["slideTitle"] = context["slideTitle"]
-
-        request_body = {
-            "prompt": prompt,
-            "presentationId": presentation_id,
-            "slideId": slide_id,
-            "elementId": element_id,
-            "context": backend_context,
-            "constraints": constraints,
-        }
+        request_body = _generate_body(
+            prompt, presentation_id, slide_id, element_id, context, constraints,
+            preset=preset, columns=columns, rows=rows, has_header=has_header, data=data
+        )
+
+        logger.info("Generating table: preset=%s, element=%s", preset, element_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body: %s", request_body)
+
+        return await self._post_json(
+            GENERATE_PATH,
+            request_body,
+            element_id=element_id,
+            action="table generation",
+            timeout_message="Table generation timed out. Please try again.",
+            cache=True,
+            no_cache=no_cache,
+            attempts=GENERATE_ATTEMPTS
+        )
+
+    async def generate_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate several tables (e.g. every table on a slide) in one round-trip.
 
-        # Build structure object if columns/rows provided
-        if columns or rows or has_header is not None:
-            structure = {}
-            if columns:
-                structure["columns"] = columns
-            if rows:
-                structure["rows"] = rows
-            if has_header is not None:
-                structure["hasHeader"] = has_header
-            request_body["structure"] = structure
-
-        # Build style object with preset
-        request_body["style"] = {
-            "preset": preset
-        }
+        Args:
+            requests: Keyword-argument dicts, one per generate() call
 
-        # Add seed data if provided
-        if data:
-            request_body["seedData"] = {"data": data}
-
-        logger.info(f"Generating table: preset={preset}, element={element_id}")
-        logger.debug(f"Request body: {request_body}")
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/ai/table/generate",
-                    json=request_body
-                )
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Table generated successfully: {element_id}")
-                return result
-
-        except httpx.TimeoutException:
-            logger.error(f"Table service timeout for element {element_id}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "TIMEOUT",
-                    "message": "Table generation timed out. Please try again.",
-                    "retryable": True
-                }
-            }
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Table service HTTP error: {e.response.status_code}")
-            try:
-                error_data = e.response.json()
-                return {
-                    "success": False,
-                    "error": error_data.get("error", {
-                        "code": f"HTTP_{e.response.status_code}",
-                        "message": str(e),
-                        "retryable": e.response.status_code >= 500
-                    })
-                }
-            except Exception:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": f"HTTP_{e.response.status_code}",
-                        "message": f"Table service returned status {e.response.status_code}",
-                        "retryable": e.response.status_code >= 500
-                    }
-                }
-
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Table service at {self.base_url}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "CONNECTION_ERROR",
-                    "message": "Unable to connect to Table AI service. Please try again later.",
-                    "retryable": True
-                }
-            }
-
-        except Exception as e:
-            logger.exception(f"Unexpected error in table generation: {e}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": str(e),
-                    "retryable": False
-                }
-            }
+        Returns:
+            Result dicts in request order
+        """
+        logger.info("Generating %d tables", len(requests))
+        return await self._generate_batch(
+            GENERATE_BATCH_PATH,
+            requests,
+            _generate_body,
+            self.generate,
+            action="table generation",
+            timeout_message="Table generation timed out. Please try again."
+        )
 
     async def transform(
         self,
@@ -197,7 +197,8 @@ class TableService:
         element_id: str,
         context: Dict[str, Any],
         constraints: Dict[str, int],
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        no_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Transform existing table content.
@@ -221,6 +222,7 @@ class TableService:
             context: Presentation context
             constraints: Grid dimensions
             options: Transformation-specific options
+            no_cache: Always transform anew instead of reusing a cached result
 
         Returns:
             Dict with success status and transformed html_content or error
@@ -238,45 +240,18 @@ class TableService:
         if options:
             request_body["options"] = options
 
-        logger.info(f"Transforming table: transformation={transformation}, element={element_id}")
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/ai/table/transform",
-                    json=request_body
-                )
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Table transformed successfully: {element_id}")
-                return result
-
-        except httpx.TimeoutException:
-            logger.error(f"Table transform timeout for element {element_id}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "TIMEOUT",
-                    "message": "Table transformation timed out. Please try again.",
-                    "retryable": True
-                }
-            }
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Table transform HTTP error: {e.response.status_code}")
-            try:
-                error_data = e.response.json()
-                return {"success": False, "error": error_data.get("error", {"code": f"HTTP_{e.response.status_code}", "message": str(e), "retryable": e.response.status_code >= 500})}
-            except Exception:
-                return {"success": False, "error": {"code": f"HTTP_{e.response.status_code}", "message": f"Table service returned status {e.response.status_code}", "retryable": e.response.status_code >= 500}}
-
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Table service at {self.base_url}")
-            return {"success": False, "error": {"code": "CONNECTION_ERROR", "message": "Unable to connect to Table AI service.", "retryable": True}}
-
-        except Exception as e:
-            logger.exception(f"Unexpected error in table transformation: {e}")
-            return {"success": False, "error": {"code": "INTERNAL_ERROR", "message": str(e), "retryable": False}}
+        logger.info("Transforming table: transformation=%s, element=%s", transformation, element_id)
+
+        return await self._post_json(
+            TRANSFORM_PATH,
+            request_body,
+            element_id=element_id,
+            action="table transformation",
+            timeout_message="Table transformation timed out. Please try again.",
+            cache=True,
+            no_cache=no_cache,
+            attempts=GENERATE_ATTEMPTS
+        )
 
     async def analyze(
         self,
@@ -306,51 +281,26 @@ class TableService:
             "elementId": element_id
         }
 
-        logger.info(f"Analyzing table: type={analysis_type}, element={element_id}")
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/ai/table/analyze",
-                    json=request_body
-                )
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Table analyzed successfully: {element_id}")
-                return result
-
-        except httpx.TimeoutException:
-            logger.error(f"Table analyze timeout for element {element_id}")
-            return {"success": False, "error": {"code": "TIMEOUT", "message": "Table analysis timed out.", "retryable": True}}
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Table analyze HTTP error: {e.response.status_code}")
-            try:
-                error_data = e.response.json()
-                return {"success": False, "error": error_data.get("error", {"code": f"HTTP_{e.response.status_code}", "message": str(e), "retryable": e.response.status_code >= 500})}
-            except Exception:
-                return {"success": False, "error": {"code": f"HTTP_{e.response.status_code}", "message": f"Table service returned status {e.response.status_code}", "retryable": e.response.status_code >= 500}}
-
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Table service at {self.base_url}")
-            return {"success": False, "error": {"code": "CONNECTION_ERROR", "message": "Unable to connect to Table AI service.", "retryable": True}}
-
-        except Exception as e:
-            logger.exception(f"Unexpected error in table analysis: {e}")
-            return {"success": False, "error": {"code": "INTERNAL_ERROR", "message": str(e), "retryable": False}}
+        logger.info("Analyzing table: type=%s, element=%s", analysis_type, element_id)
+
+        return await self._post_json(
+            ANALYZE_PATH,
+            request_body,
+            element_id=element_id,
+            action="table analysis",
+            timeout_message="Table analysis timed out."
+        )
+
+    def clear_cache(self):
+        """Clear cached generate/transform results"""
+        self.clear_result_cache()
+        logger.info("Table service cache cleared")
 
     def get_presets(self) -> Dict[str, Any]:
         """
         Get available table presets.
 
         Returns:
-            Dict with presets array and descriptions
+            Dict with presets array and descriptions (shared; do not mutate)
         """
-        return {
-            "success": True,
-            "presets": [
-                {"name": name, "description": desc}
-                for name, desc in TABLE_PRESETS.items()
-            ],
-            "defaultPreset": "professional"
-        }
+        return _PRESETS_RESPONSE
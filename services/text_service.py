@@ -6,35 +6,101 @@ Handles communication with the Text Table Builder v1.2 Text endpoints.
 Endpoints:
     - POST /api/ai/text/generate - Generate text content
     - POST /api/ai/text/transform - Transform existing text
+    - POST /api/ai/text/batch - Generate several text elements at once
     - POST /api/ai/text/autofit - Auto-fit text to container
     - GET /api/ai/constraints/{width}/{height} - Get text constraints
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-import httpx
+import orjson
+from cachetools import LRUCache
 
 from config import settings
+from services.base_service import GENERATE_ATTEMPTS, BaseAIService, build_slide_context
+from services.concurrency import gather_bounded
+from services.shared_cache import load_snapshot, save_snapshot, shared_cache
 
 logger = logging.getLogger(__name__)
 
-
-class TextService:
+# Endpoint paths, relative to the client's base_url
+GENERATE_PATH = "/api/ai/text/generate"
+GENERATE_BATCH_PATH = "/api/ai/text/batch"
+TRANSFORM_PATH = "/api/ai/text/transform"
+AUTOFIT_PATH = "/api/ai/text/autofit"
+
+# Grid sizes fetched by warmup() (12 columns x 8 rows)
+GRID_SIZES = tuple((width, height) for width in range(1, 13) for height in range(1, 9))
+
+# Snapshot name for constraints saved across restarts (see shared_cache)
+CONSTRAINTS_SNAPSHOT = "text_constraints"
+
+# Seconds constraints stay in the cross-worker shared cache; they only change
+# when the Text service is redeployed
+CONSTRAINTS_SHARED_TTL = 86400.0
+
+
+def _generate_body(
+    prompt: str,
+    presentation_id: str,
+    slide_id: str,
+    element_id: str,
+    context: Dict[str, Any],
+    constraints: Dict[str, int],
+    tone: str = "professional",
+    format: str = "paragraph",
+    max_words: Optional[int] = None,
+    language: str = "en"
+) -> Dict[str, Any]:
+    """Build a text generate request body (also one item of a batch)"""
+    # Build options object matching backend TextOptions schema
+    options = {
+        "tone": tone,
+        "format": format,
+        "language": language
+    }
+
+    request_body = {
+        "prompt": prompt,
+        "presentationId": presentation_id,
+        "slideId": slide_id,
+        "elementId": element_id,
+        "context": build_slide_context(context),
+        "constraints": constraints,
+        "options": options
+    }
+    return request_body
+
+
+class TextService(BaseAIService):
     """
     Client for the Text AI Service.
 
     Features:
+        - Shared pooled HTTP/2 client (connections reused across calls)
         - Async HTTP calls with configurable timeout
         - Response caching for constraints
         - Support for text generation, transformation, and auto-fit
         - Error handling with retryable status
     """
 
+    service_name = "Text"
+
     def __init__(self):
-        self.base_url = settings.TEXT_TABLE_SERVICE_URL
-        self.timeout = settings.SERVICE_TIMEOUT
-        self._constraints_cache: Dict[str, Dict[str, Any]] = {}
+        super().__init__(
+            settings.TEXT_TABLE_SERVICE_URL,
+            settings.SERVICE_TIMEOUT,
+            settings.TEXT_TABLE_BATCH_ENABLED,
+            result_cache_ttl=settings.TEXT_TABLE_RESULT_CACHE_TTL
+        )
+        self._constraints_cache: LRUCache = LRUCache(maxsize=128)
+        # Start warm from the last snapshot a previous process saved
+        snapshot = load_snapshot(CONSTRAINTS_SNAPSHOT, settings.CACHE_STALE_TTL)
+        if snapshot is not None:
+            for width, height, constraints in snapshot[1]:
+                self._constraints_cache[(width, height)] = constraints
 
     async def generate(
         self,
@@ -47,7 +113,8 @@ class TextService:
         tone: str = "professional",
         format: str = "paragraph",
         max_words: Optional[int] = None,
-        language: str = "en"
+        language: str = "en",
+        no_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Generate text content via Text AI Service.
@@ -63,108 +130,50 @@ class TextService:
             format: Output format (paragraph, bullets, numbered, etc.)
             max_words: Maximum word count
             language: ISO language code (default "en")
+            no_cache: Always generate new text instead of reusing a cached result
 
         Returns:
             Dict with success status and either html_content or error details
         """
-        # Build context object matching backend SlideContext schema
-        # Required fields: presentationTitle, slideIndex, slideCount
-        backend_context = {
-            "presentationTitle": context.get("presentationTitle", "Untitled"),
-            "slideIndex": context.get("slideIndex", 0),
-            "slideCount": context.get("slideCount", 1),
-        }
-        # Optional context fields
-        if context.get("presentationTheme"):
-            backend_context["presentationTheme"] = context["presentationTheme"]
-        if context.get("slideTitle"):
-            backend_context["slideTitle"] = context["slideTitle"]
-
-        # Build options object matching backend TextOptions schema
-        options = {
-            "tone": tone,
-            "format": format,
-            "language": language
-        }
-
-        request_body = {
-            "prompt": prompt,
-            "presentationId": presentation_id,
-            "slideId": slide_id,
-            "elementId": element_id,
-            "context": backend_context,
-            "constraints": constraints,
-            "options": options
-        }
-
-        logger.info(f"Generating text: tone={tone}, format={format}, element={element_id}")
-        logger.debug(f"Request body: {request_body}")
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/ai/text/generate",
-                    json=request_body
-                )
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Text generated successfully: {element_id}")
-                return result
-
-        except httpx.TimeoutException:
-            logger.error(f"Text service timeout for element {element_id}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "TIMEOUT",
-                    "message": "Text generation timed out. Please try again.",
-                    "retryable": True
-                }
-            }
+        request_body = _generate_body(
+            prompt, presentation_id, slide_id, element_id, context, constraints,
+            tone=tone, format=format, max_words=max_words, language=language
+        )
+
+        logger.info("Generating text: tone=%s, format=%s, element=%s", tone, format, element_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body: %s", request_body)
+
+        return await self._post_json(
+            GENERATE_PATH,
+            request_body,
+            element_id=element_id,
+            action="text generation",
+            timeout_message="Text generation timed out. Please try again.",
+            cache=True,
+            no_cache=no_cache,
+            attempts=GENERATE_ATTEMPTS
+        )
+
+    async def generate_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate several text elements (e.g. every text box on a slide) in one round-trip.
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Text service HTTP error: {e.response.status_code}")
-            try:
-                error_data = e.response.json()
-                return {
-                    "success": False,
-                    "error": error_data.get("error", {
-                        "code": f"HTTP_{e.response.status_code}",
-                        "message": str(e),
-                        "retryable": e.response.status_code >= 500
-                    })
-                }
-            except Exception:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": f"HTTP_{e.response.status_code}",
-                        "message": f"Text service returned status {e.response.status_code}",
-                        "retryable": e.response.status_code >= 500
-                    }
-                }
-
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Text service at {self.base_url}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "CONNECTION_ERROR",
-                    "message": "Unable to connect to Text AI service. Please try again later.",
-                    "retryable": True
-                }
-            }
+        Args:
+            requests: Keyword-argument dicts, one per generate() call
 
-        except Exception as e:
-            logger.exception(f"Unexpected error in text generation: {e}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": str(e),
-                    "retryable": False
-                }
-            }
+        Returns:
+            Result dicts in request order
+        """
+        logger.info("Generating %d text elements", len(requests))
+        return await self._generate_batch(
+            GENERATE_BATCH_PATH,
+            requests,
+            _generate_body,
+            self.generate,
+            action="text generation",
+            timeout_message="Text generation timed out. Please try again."
+        )
 
     async def transform(
         self,
@@ -176,7 +185,8 @@ class TextService:
         context: Dict[str, Any],
         constraints: Dict[str, int],
         target_language: Optional[str] = None,
-        intensity: Optional[float] = None
+        intensity: Optional[float] = None,
+        no_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Transform existing text content.
@@ -191,21 +201,11 @@ class TextService:
             constraints: Grid dimensions
             target_language: Target language for translate transformation
             intensity: Transformation intensity (0.0-1.0)
+            no_cache: Always transform anew instead of reusing a cached result
 
         Returns:
             Dict with success status and transformed html_content or error
         """
-        # Build context object matching backend SlideContext schema
-        backend_context = {
-            "presentationTitle": context.get("presentationTitle", "Untitled"),
-            "slideIndex": context.get("slideIndex", 0),
-            "slideCount": context.get("slideCount", 1),
-        }
-        if context.get("presentationTheme"):
-            backend_context["presentationTheme"] = context["presentationTheme"]
-        if context.get("slideTitle"):
-            backend_context["slideTitle"] = context["slideTitle"]
-
         # Build options if target_language or intensity provided
         options = {}
         if target_language:
@@ -219,52 +219,25 @@ class TextService:
             "presentationId": presentation_id,
             "slideId": slide_id,
             "elementId": element_id,
-            "context": backend_context,
+            "context": build_slide_context(context),
             "constraints": constraints
         }
 
         if options:
             request_body["options"] = options
 
-        logger.info(f"Transforming text: transformation={transformation}, element={element_id}")
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/ai/text/transform",
-                    json=request_body
-                )
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Text transformed successfully: {element_id}")
-                return result
-
-        except httpx.TimeoutException:
-            logger.error(f"Text transform timeout for element {element_id}")
-            return {
-                "success": False,
-                "error": {
-                    "code": "TIMEOUT",
-                    "message": "Text transformation timed out. Please try again.",
-                    "retryable": True
-                }
-            }
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Text transform HTTP error: {e.response.status_code}")
-            try:
-                error_data = e.response.json()
-                return {"success": False, "error": error_data.get("error", {"code": f"HTTP_{e.response.status_code}", "message": str(e), "retryable": e.response.status_code >= 500})}
-            except Exception:
-                return {"success": False, "error": {"code": f"HTTP_{e.response.status_code}", "message": f"Text service returned status {e.response.status_code}", "retryable": e.response.status_code >= 500}}
-
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Text service at {self.base_url}")
-            return {"success": False, "error": {"code": "CONNECTION_ERROR", "message": "Unable to connect to Text AI service.", "retryable": True}}
+        logger.info("Transforming text: transformation=%s, element=%s", transformation, element_id)
 
-        except Exception as e:
-            logger.exception(f"Unexpected error in text transformation: {e}")
-            return {"success": False, "error": {"code": "INTERNAL_ERROR", "message": str(e), "retryable": False}}
+        return await self._post_json(
+            TRANSFORM_PATH,
+            request_body,
+            element_id=element_id,
+            action="text transformation",
+            timeout_message="Text transformation timed out. Please try again.",
+            cache=True,
+            no_cache=no_cache,
+            attempts=GENERATE_ATTEMPTS
+        )
 
     async def autofit(
         self,
@@ -286,65 +259,45 @@ class TextService:
             slide_id: Slide identifier
             element_id: Element identifier
             context: Presentation context
-            constraints: Grid dimensions
+            constraints: Grid dimensions (not modified; safe to pass a shared dict)
             target_characters: Target character count (optional)
             preserve_structure: Maintain original structure (default True)
 
         Returns:
             Dict with success status and fitted html_content or error
         """
+        # Copy so the caller's constraints dict is never modified
+        target_fit = dict(constraints)
+        if target_characters:
+            target_fit["maxCharacters"] = target_characters
+
         # Backend expects 'content' not 'sourceContent', 'targetFit' not 'constraints'
         request_body = {
             "content": source_content,
             "presentationId": presentation_id,
             "slideId": slide_id,
             "elementId": element_id,
-            "targetFit": constraints,  # Backend uses 'targetFit' for autofit
+            "targetFit": target_fit,  # Backend uses 'targetFit' for autofit
             "strategy": "smart_condense",  # Default strategy
             "preserveFormatting": preserve_structure
         }
 
-        if target_characters:
-            request_body["targetFit"]["maxCharacters"] = target_characters
-
-        logger.info(f"Auto-fitting text: element={element_id}")
+        logger.info("Auto-fitting text: element=%s", element_id)
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/ai/text/autofit",
-                    json=request_body
-                )
-                response.raise_for_status()
-                result = response.json()
-                logger.info(f"Text auto-fitted successfully: {element_id}")
-                return result
-
-        except httpx.TimeoutException:
-            logger.error(f"Text autofit timeout for element {element_id}")
-            return {"success": False, "error": {"code": "TIMEOUT", "message": "Text auto-fit timed out.", "retryable": True}}
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Text autofit HTTP error: {e.response.status_code}")
-            try:
-                error_data = e.response.json()
-                return {"success": False, "error": error_data.get("error", {"code": f"HTTP_{e.response.status_code}", "message": str(e), "retryable": e.response.status_code >= 500})}
-            except Exception:
-                return {"success": False, "error": {"code": f"HTTP_{e.response.status_code}", "message": f"Text service returned status {e.response.status_code}", "retryable": e.response.status_code >= 500}}
-
-        except httpx.ConnectError:
-            logger.error(f"Failed to connect to Text service at {self.base_url}")
-            return {"success": False, "error": {"code": "CONNECTION_ERROR", "message": "Unable to connect to Text AI service.", "retryable": True}}
-
-        except Exception as e:
-            logger.exception(f"Unexpected error in text autofit: {e}")
-            return {"success": False, "error": {"code": "INTERNAL_ERROR", "message": str(e), "retryable": False}}
+        return await self._post_json(
+            AUTOFIT_PATH,
+            request_body,
+            element_id=element_id,
+            action="text autofit",
+            timeout_message="Text auto-fit timed out."
+        )
 
     async def get_constraints(self, width: int, height: int) -> Dict[str, Any]:
         """
         Get text constraints for a given grid size.
 
-        Results are cached after first successful call for each size.
+        Results are cached after first successful call for each size, in
+        process and in the shared cache (when configured) for other workers.
 
         Args:
             width: Grid width (1-12)
@@ -353,26 +306,37 @@ class TextService:
         Returns:
             Dict with maxCharacters, maxLines, recommendedFontSize, maxBullets
         """
-        cache_key = f"{width}x{height}"
+        cache_key = (width, height)
 
-        if cache_key in self._constraints_cache:
-            logger.debug(f"Returning cached text constraints for {cache_key}")
-            return self._constraints_cache[cache_key]
+        cached = self._constraints_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Returning cached text constraints for %dx%d", width, height)
+            return cached
 
-        logger.info(f"Fetching text constraints for {cache_key}")
+        # Another worker may already have fetched them
+        shared_key = f"text:constraints:{width}x{height}"
+        shared = await shared_cache.get(shared_key)
+        if shared is not None:
+            logger.debug("Returning text constraints for %dx%d from shared cache", width, height)
+            self._constraints_cache[cache_key] = shared
+            return shared
+
+        logger.info("Fetching text constraints for %dx%d", width, height)
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/ai/constraints/{width}/{height}"
-                )
-                response.raise_for_status()
-                result = response.json()
-                self._constraints_cache[cache_key] = result
-                return result
+            client = self._get_client()
+            response = await client.get(
+                f"/api/ai/constraints/{width}/{height}",
+                timeout=10
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            self._constraints_cache[cache_key] = result
+            await shared_cache.set(shared_key, result, CONSTRAINTS_SHARED_TTL)
+            return result
 
         except Exception as e:
-            logger.error(f"Failed to fetch text constraints: {e}")
+            logger.error("Failed to fetch text constraints: %s", e)
             # Return estimated constraints based on grid size
             area = width * height
             return {
@@ -387,7 +351,33 @@ class TextService:
                 "_fallback": True
             }
 
+    async def warmup(self):
+        """
+        Fetch constraints for every grid size so requests never wait on them.
+
+        Sizes already loaded from the snapshot are skipped. Gives up if the
+        first fetch fails (service unreachable); otherwise saves the filled
+        cache as a snapshot for the next process.
+        """
+        missing = [size for size in GRID_SIZES if size not in self._constraints_cache]
+        if not missing:
+            return
+
+        first = await self.get_constraints(*missing[0])
+        if first.get("_fallback"):
+            logger.warning("Skipping text constraints warmup; Text service is unavailable")
+            return
+        await gather_bounded(
+            (lambda size=size: self.get_constraints(*size) for size in missing[1:]),
+            concurrency=8
+        )
+
+        payload = [[width, height, constraints] for (width, height), constraints in self._constraints_cache.items()]
+        await asyncio.to_thread(save_snapshot, CONSTRAINTS_SNAPSHOT, payload)
+        logger.info("Warmed text constraints for %d grid sizes", len(payload))
+
     def clear_cache(self):
-        """Clear cached constraints"""
-        self._constraints_cache = {}
+        """Clear cached constraints and generate/transform results"""
+        self._constraints_cache.clear()
+        self.clear_result_cache()
         logger.info("Text service cache cleared")
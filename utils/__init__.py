@@ -2,6 +2,6 @@
 Utility modules for Visual Elements Orchestrator
 """
 
-from .grid_utils import convert_grid_position, get_grid_dimensions
+from .grid_utils import convert_grid_position, convert_grid_positions, get_grid_dimensions
 
-__all__ = ["convert_grid_position", "get_grid_dimensions"]
+__all__ = ["convert_grid_position", "convert_grid_positions", "get_grid_dimensions"]
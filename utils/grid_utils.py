@@ -8,11 +8,54 @@ Layout Service Grid: 24 columns x 14 rows
 Chart AI Grid: 12 columns x 8 rows
 """
 
-import re
-from typing import Dict, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from models import GridPosition
 
+# Dimensions used when a grid value can't be parsed (shared, read-only)
+_DEFAULT_DIMS = MappingProxyType({
+    "row_start": 4,
+    "row_end": 12,
+    "col_start": 4,
+    "col_end": 20,
+    "row_span": 8,
+    "col_span": 16
+})
+
+# Chart AI (width, height) are packed into one int, (width << 4) | height:
+# width <= 12 and height <= 8 each fit in 4 bits
+_PACK_SHIFT = 4
+_PACK_MASK = 0xF
+
+# Area and size category for every packed (width, height)
+_AREA_LUT = bytes((packed >> _PACK_SHIFT) * (packed & _PACK_MASK) for packed in range(256))
+_CATEGORY_LUT = tuple(
+    "small" if area <= 16 else "medium" if area <= 48 else "large"
+    for area in _AREA_LUT
+)
+
+# Minimum (width, height) per chart type, in Chart AI grid units
+_MINIMUM_SIZES = {
+    "bar": (3, 3),
+    "line": (3, 2),
+    "pie": (3, 3),
+    "doughnut": (3, 3),
+    "area": (3, 2),
+    "scatter": (4, 3),
+    "radar": (4, 4),
+    "polarArea": (3, 3)
+}
+_DEFAULT_MIN_SIZE = (3, 3)
+
+# Read-only {"valid": True, ...} result for every packed Chart AI (width, height)
+_VALID_RESULTS: Dict[int, Mapping[str, Any]] = {
+    (width << _PACK_SHIFT) | height: MappingProxyType({"valid": True, "width": width, "height": height})
+    for width in range(1, 13)
+    for height in range(1, 9)
+}
+
 
 def parse_grid_value(value: str) -> Tuple[int, int]:
     """
@@ -27,44 +70,122 @@ def parse_grid_value(value: str) -> Tuple[int, int]:
     Raises:
         ValueError: If the value cannot be parsed
     """
-    match = re.match(r'(\d+)\s*/\s*(\d+)', value.strip())
-    if not match:
+    start, sep, end = value.partition("/")
+    start = start.strip()
+    end = end.strip()
+    # isdigit() rejects signs, underscores and blanks that int() would accept
+    if not (sep and start.isdigit() and end.isdigit()):
         raise ValueError(f"Invalid grid value: {value}")
-    return int(match.group(1)), int(match.group(2))
+    return int(start), int(end)
+
+
+@lru_cache(maxsize=4096)
+def _parse_position(grid_row: str, grid_column: str) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Parse both grid values in one pass, as parse_grid_value would.
+
+    Memoized on the two strings, so a position is parsed once however often
+    it is looked up, and a copy with new values is never served stale.
+
+    Returns:
+        (row_start, row_end, col_start, col_end), or None if either value
+        can't be parsed
+    """
+    row_start, row_sep, row_end = grid_row.partition("/")
+    col_start, col_sep, col_end = grid_column.partition("/")
+    row_start = row_start.strip()
+    row_end = row_end.strip()
+    col_start = col_start.strip()
+    col_end = col_end.strip()
+    if not (
+        row_sep and col_sep
+        and row_start.isdigit() and row_end.isdigit()
+        and col_start.isdigit() and col_end.isdigit()
+    ):
+        return None
+    try:
+        return int(row_start), int(row_end), int(col_start), int(col_end)
+    except ValueError:
+        # isdigit() also accepts digits int() rejects (e.g. superscripts)
+        return None
 
 
-def get_grid_dimensions(position: GridPosition) -> Dict[str, int]:
+def get_grid_dimensions(position: GridPosition) -> Mapping[str, int]:
     """
     Get the raw grid dimensions (spans) from a GridPosition.
 
+    Kept for external callers; the conversion helpers below don't use it.
+
     Args:
         position: GridPosition with grid_row and grid_column
 
     Returns:
-        Dict with row_span and col_span
+        Dict with row_span and col_span (the shared read-only default
+        block if the position can't be parsed)
     """
-    try:
-        row_start, row_end = parse_grid_value(position.grid_row)
-        col_start, col_end = parse_grid_value(position.grid_column)
-
-        return {
-            "row_start": row_start,
-            "row_end": row_end,
-            "col_start": col_start,
-            "col_end": col_end,
-            "row_span": row_end - row_start,
-            "col_span": col_end - col_start
-        }
-    except ValueError:
+    parsed = _parse_position(position.grid_row, position.grid_column)
+    if parsed is None:
         # Return default dimensions if parsing fails
-        return {
-            "row_start": 4,
-            "row_end": 12,
-            "col_start": 4,
-            "col_end": 20,
-            "row_span": 8,
-            "col_span": 16
-        }
+        return _DEFAULT_DIMS
+    row_start, row_end, col_start, col_end = parsed
+
+    return {
+        "row_start": row_start,
+        "row_end": row_end,
+        "col_start": col_start,
+        "col_end": col_end,
+        "row_span": row_end - row_start,
+        "col_span": col_end - col_start
+    }
+
+
+def _convert_core(row_span: int, col_span: int) -> Tuple[int, int]:
+    """Scale Layout Service spans to clamped Chart AI (width, height)"""
+    # Convert to Chart AI grid dimensions, in integer arithmetic only
+    # Layout: 24 cols -> Chart: 12 cols (divide by 2). Same as
+    # round(col_span / 2), ties to even: 1 -> 0, 3 -> 2, 5 -> 2
+    grid_width = (col_span + ((col_span >> 1) & 1)) >> 1
+
+    # Layout: 14 rows -> Chart: 8 rows (multiply by 8/14 = 0.571). Same as
+    # round(row_span * 8 / 14): 8 * row_span is even, so it is never a tie
+    grid_height = (row_span * 8 + 7) // 14
+
+    # Clamp to valid ranges (comparisons, not max/min calls)
+    grid_width = 1 if grid_width < 1 else 12 if grid_width > 12 else grid_width
+    grid_height = 1 if grid_height < 1 else 8 if grid_height > 8 else grid_height
+
+    return grid_width, grid_height
+
+
+# _convert_core results for every span that fits the Layout grid (0-24
+# columns, 0-14 rows)
+_WIDTH_LUT = tuple(_convert_core(0, span)[0] for span in range(25))
+_HEIGHT_LUT = tuple(_convert_core(span, 0)[1] for span in range(15))
+
+
+@lru_cache(maxsize=4096)
+def _convert_grid_position_cached(grid_row: str, grid_column: str) -> int:
+    """
+    Memoized core of convert_grid_position: packed Chart AI (width, height)
+    for one position. Entry points call it directly with the position's two
+    strings, so the hot path is one attribute read each and a cache lookup.
+    """
+    parsed = _parse_position(grid_row, grid_column)
+    if parsed is None:
+        row_span = _DEFAULT_DIMS["row_span"]
+        col_span = _DEFAULT_DIMS["col_span"]
+    else:
+        row_start, row_end, col_start, col_end = parsed
+        row_span = row_end - row_start
+        col_span = col_end - col_start
+
+    # Spans inside the Layout grid are a table lookup
+    if 0 <= col_span < len(_WIDTH_LUT) and 0 <= row_span < len(_HEIGHT_LUT):
+        grid_width = _WIDTH_LUT[col_span]
+        grid_height = _HEIGHT_LUT[row_span]
+    else:
+        grid_width, grid_height = _convert_core(row_span, col_span)
+    return (grid_width << _PACK_SHIFT) | grid_height
 
 
 def convert_grid_position(position: GridPosition) -> Dict[str, int]:
@@ -84,32 +205,43 @@ def convert_grid_position(position: GridPosition) -> Dict[str, int]:
         - Layout 24 cols -> Chart AI 12 cols (divide by 2)
         - Layout 14 rows -> Chart AI 8 rows (multiply by 8/14)
 
+    Results are memoized per (grid_row, grid_column) pair, so repeated
+    conversions of one position (validation, area, category) are a lookup.
+
     Args:
         position: GridPosition from Layout Service
 
     Returns:
         Dict with "width" and "height" for Chart AI
     """
-    dims = get_grid_dimensions(position)
+    packed = _convert_grid_position_cached(position.grid_row, position.grid_column)
 
-    row_span = dims["row_span"]
-    col_span = dims["col_span"]
+    # Fresh dict per call: callers may modify it
+    return {
+        "width": packed >> _PACK_SHIFT,
+        "height": packed & _PACK_MASK
+    }
 
-    # Convert to Chart AI grid dimensions
-    # Layout: 24 cols -> Chart: 12 cols (divide by 2)
-    grid_width = round(col_span / 2)
 
-    # Layout: 14 rows -> Chart: 8 rows (multiply by 8/14 = 0.571)
-    grid_height = round(row_span * 8 / 14)
+def convert_grid_positions(positions: Iterable[GridPosition]) -> List[Dict[str, int]]:
+    """
+    Convert many grid positions at once (e.g. every element on a slide).
 
-    # Clamp to valid ranges
-    grid_width = max(1, min(12, grid_width))
-    grid_height = max(1, min(8, grid_height))
+    Same result as calling convert_grid_position for each position, in
+    order. Elements on one slide usually share a handful of positions, so
+    each distinct (grid_row, grid_column) pair is converted once.
 
-    return {
-        "width": grid_width,
-        "height": grid_height
-    }
+    Args:
+        positions: GridPositions from Layout Service
+
+    Returns:
+        List of dicts with "width" and "height" for Chart AI
+    """
+    converted = []
+    for position in positions:
+        packed = _convert_grid_position_cached(position.grid_row, position.grid_column)
+        converted.append({"width": packed >> _PACK_SHIFT, "height": packed & _PACK_MASK})
+    return converted
 
 
 def calculate_grid_area(position: GridPosition) -> int:
@@ -127,8 +259,7 @@ def calculate_grid_area(position: GridPosition) -> int:
     Returns:
         Grid area (width * height in Chart AI units)
     """
-    dims = convert_grid_position(position)
-    return dims["width"] * dims["height"]
+    return _AREA_LUT[_convert_grid_position_cached(position.grid_row, position.grid_column)]
 
 
 def get_size_category(position: GridPosition) -> str:
@@ -141,14 +272,29 @@ def get_size_category(position: GridPosition) -> str:
     Returns:
         Size category string: "small", "medium", or "large"
     """
-    area = calculate_grid_area(position)
+    return _CATEGORY_LUT[_convert_grid_position_cached(position.grid_row, position.grid_column)]
 
-    if area <= 16:
-        return "small"
-    elif area <= 48:
-        return "medium"
-    else:
-        return "large"
+
+def _make_validator(min_width: int, min_height: int) -> Callable[[int, int, str], Optional[Dict[str, Any]]]:
+    """Build a size check for one minimum; it returns the error dict, or None if the size fits"""
+    def validate(grid_width: int, grid_height: int, chart_type: str) -> Optional[Dict[str, Any]]:
+        if grid_width >= min_width and grid_height >= min_height:
+            return None
+        return {
+            "valid": False,
+            "current_width": grid_width,
+            "current_height": grid_height,
+            "min_width": min_width,
+            "min_height": min_height,
+            "message": f"Grid size {grid_width}x{grid_height} is too small for {chart_type} chart. Minimum size is {min_width}x{min_height}."
+        }
+
+    return validate
+
+
+# Size check per chart type, specialized on its minimum
+_VALIDATORS = {chart_type: _make_validator(*size) for chart_type, size in _MINIMUM_SIZES.items()}
+_DEFAULT_VALIDATOR = _make_validator(*_DEFAULT_MIN_SIZE)
 
 
 def validate_minimum_size(position: GridPosition, chart_type: str) -> Dict[str, any]:
@@ -170,34 +316,11 @@ def validate_minimum_size(position: GridPosition, chart_type: str) -> Dict[str,
         chart_type: Type of chart to validate
 
     Returns:
-        Dict with "valid" bool and error details if invalid
-    """
-    MINIMUM_SIZES = {
-        "bar": {"width": 3, "height": 3},
-        "line": {"width": 3, "height": 2},
-        "pie": {"width": 3, "height": 3},
-        "doughnut": {"width": 3, "height": 3},
-        "area": {"width": 3, "height": 2},
-        "scatter": {"width": 4, "height": 3},
-        "radar": {"width": 4, "height": 4},
-        "polarArea": {"width": 3, "height": 3}
-    }
-
-    dims = convert_grid_position(position)
-    min_size = MINIMUM_SIZES.get(chart_type, {"width": 3, "height": 3})
-
-    if dims["width"] < min_size["width"] or dims["height"] < min_size["height"]:
-        return {
-            "valid": False,
-            "current_width": dims["width"],
-            "current_height": dims["height"],
-            "min_width": min_size["width"],
-            "min_height": min_size["height"],
-            "message": f"Grid size {dims['width']}x{dims['height']} is too small for {chart_type} chart. Minimum size is {min_size['width']}x{min_size['height']}."
-        }
-
-    return {
-        "valid": True,
-        "width": dims["width"],
-        "height": dims["height"]
-    }
+        Dict with "valid" bool and error details if invalid. A valid
+        result is shared and read-only.
+    """
+    packed = _convert_grid_position_cached(position.grid_row, position.grid_column)
+    error = _VALIDATORS.get(chart_type, _DEFAULT_VALIDATOR)(
+        packed >> _PACK_SHIFT, packed & _PACK_MASK, chart_type
+    )
+    return error or _VALID_RESULTS[packed]